@@ -35,6 +35,14 @@ class DhanService:
             "client-id": self.client_id
         }
         
+        # Persistent session so requests reuse pooled keep-alive connections
+        # instead of paying a TCP/TLS handshake per call
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip"
+        })
+        
         logger.info("Dhan Service initialized")
     
     def _make_request(self, endpoint: str, method: str = "GET", data: Dict = None) -> Optional[Dict]:
@@ -45,9 +53,9 @@ class DhanService:
             logger.info(f"Headers: {self.headers}")
             
             if method == "GET":
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = self.session.get(url, headers=self.headers, timeout=10)
             elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data, timeout=10)
+                response = self.session.post(url, headers=self.headers, json=data, timeout=10)
             else:
                 logger.error(f"Unsupported HTTP method: {method}")
                 return None
@@ -374,12 +374,12 @@ class MarketScannerManager:
                 # Update the scanner's stock universe
                 if stock_list is None:
                     # Use default universe
-                    self.market_scanner.stock_universe = self.market_scanner._load_stock_universe()
+                    self.market_scanner.set_stock_universe()
                     self.current_universe_id = "default"
                     self.current_universe_name = "Default (174 stocks)"
                 else:
                     # Use custom universe
-                    self.market_scanner.stock_universe = stock_list
+                    self.market_scanner.set_stock_universe(stock_list)
                     self.current_universe_id = universe_id
                     
                     # Map universe names
@@ -426,7 +426,7 @@ class MarketScannerManager:
                     "universe_id": self.current_universe_id,
                     "universe_name": self.current_universe_name,
                     "stock_count": len(self.market_scanner.stock_universe),
-                    "stocks": self.market_scanner.stock_universe[:10]  # Show first 10 stocks as preview
+                    "stocks": list(self.market_scanner.stock_universe[:10])  # Show first 10 stocks as preview
                 }
             else:
                 return {
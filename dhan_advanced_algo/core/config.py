@@ -55,6 +55,13 @@ class BrokerConfig:
     request_timeout: int = 30
     max_retries: int = 3
     rate_limit_delay: float = 1.0  # Increased from 0.1 to 1 second to respect Dhan's rate limits
+    bulk_concurrency: int = 8  # Concurrent in-flight requests for bulk LTP fetches
+    ltp_cache_ttl: float = 0.5  # Seconds a cached LTP is served without refreshing
+    ltp_cache_stale_ttl: float = 5.0  # Seconds an expired LTP may be served while refreshing in background
+    ltp_cache_size: int = 1024  # Maximum number of symbols kept in the LTP cache
+    invalid_symbol_ttl: float = 60.0  # Seconds a failed symbol validation is remembered
+    bar_buffer_size: int = 500  # Bars kept per symbol in the rolling OHLCV buffer
+    scrip_master_cache_file: str = "scrip_master_cache.json"  # On-disk copy of the parsed scrip master
 
 
 @dataclass
@@ -97,14 +104,30 @@ class MarketScannerConfig:
     max_concurrent_stocks: int = 3  # Reduced from 10 to 3 to avoid overwhelming Dhan's API
     batch_size: int = 2  # Reduced from 5 to 2 for smaller batches
     timeout_seconds: int = 30  # Timeout for individual stock analysis
+    max_rps: float = 20.0  # Market data requests per second from the scanner (0 disables the limit)
+    indicator_cache_dir: Optional[str] = None  # Directory to persist indicator series in (None keeps them in memory only)
+    indicator_cache_save_seconds: int = 900  # Minimum time between indicator cache writes
     stock_universe: Optional[List[str]] = None  # Custom stock universe (if None, uses default)
 
 
+@dataclass
+class MarketDataConfig:
+    """Market data provider configuration parameters."""
+    cache_timeout_seconds: int = 300  # How long a cached quote stays fresh
+    max_cache_size: int = 1000  # Maximum number of cached quotes
+    update_interval_seconds: int = 60  # Delay between cache refresh cycles
+    active_update_interval_seconds: int = 10  # Refresh delay while the market is open
+    idle_update_interval_seconds: int = 300  # Refresh delay while the market is closed
+    max_concurrency: int = 40  # Maximum in-flight Dhan requests per refresh
+    batch_size: int = 200  # Symbols scheduled per refresh batch
+
+
 @dataclass
 class EODSummaryConfig:
     """EOD Summary configuration parameters."""
     report_retention_days: int = 30  # Number of days to keep reports
     min_confidence_threshold: float = 0.7  # Minimum confidence for including in reports
+    cleanup_interval_seconds: float = 3600.0  # Minimum time between retention sweeps
 
 
 class ConfigurationManager:
@@ -131,6 +154,8 @@ class ConfigurationManager:
             self._system_config = SystemConfig()
             self._market_scanner_config = MarketScannerConfig()
             self._eod_summary_config = EODSummaryConfig()
+            self._market_data_config = MarketDataConfig()
+            self._config_version = 0  # Bumped on every reload so caches can detect stale entries
             
             self._initialized = True
     
@@ -170,6 +195,8 @@ class ConfigurationManager:
             enable_debug = os.getenv('ENABLE_DEBUG')
             if enable_debug:
                 self._system_config.enable_debug_mode = enable_debug.lower() == 'true'
+            
+            self._config_version += 1
                 
         except Exception as e:
             raise ConfigurationException(f"Failed to load environment configuration: {str(e)}")
@@ -194,6 +221,8 @@ class ConfigurationManager:
                 self._update_database_config(config_data['database'])
             if 'system' in config_data:
                 self._update_system_config(config_data['system'])
+            
+            self._config_version += 1
                 
         except Exception as e:
             raise ConfigurationException(f"Failed to load configuration file {config_file_path}: {str(e)}")
@@ -245,6 +274,11 @@ class ConfigurationManager:
         """Get a custom configuration value."""
         return self._custom_config.get(key, default)
     
+    @property
+    def config_version(self) -> int:
+        """Counter incremented each time configuration is (re)loaded."""
+        return self._config_version
+    
     # Property getters for each configuration section
     @property
     def trading(self) -> TradingConfig:
@@ -278,6 +312,10 @@ class ConfigurationManager:
     def eod_summary(self) -> EODSummaryConfig:
         return self._eod_summary_config
     
+    @property
+    def market_data(self) -> MarketDataConfig:
+        return self._market_data_config
+    
     def validate_configuration(self) -> bool:
         """Validate that all required configuration is present."""
         required_fields = [
@@ -8,9 +8,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from uuid import UUID, uuid4
 
+import numpy as np
+
 
 class OrderType(Enum):
     """Enumeration of order types."""
@@ -164,9 +166,9 @@ class Trade:
     remarks: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketData:
-    """Represents market data for a symbol."""
+    """Represents market data for a symbol (immutable snapshot)."""
     symbol: str = ""
     ltp: Optional[Decimal] = None
     open: Optional[Decimal] = None
@@ -189,8 +191,117 @@ class MarketData:
 
 
 @dataclass
+class MarketDataFrame:
+    """Columnar (struct-of-arrays) market data for one symbol."""
+    symbol: str = ""
+    ts: np.ndarray = field(default_factory=lambda: np.empty(0, dtype='datetime64[ns]'))
+    open: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    high: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    low: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    close: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    volume: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    
+    def __len__(self) -> int:
+        return len(self.close)
+    
+    def to_list(self, to_price: Optional[Callable[[float], Decimal]] = None) -> List[MarketData]:
+        """Convert to a list of MarketData rows (close doubles as LTP)."""
+        if to_price is None:
+            to_price = lambda value: Decimal(repr(value))
+        
+        timestamps = self.ts.astype('datetime64[us]').tolist()
+        return [
+            MarketData(
+                symbol=self.symbol,
+                ltp=to_price(close),
+                open=to_price(open_),
+                high=to_price(high),
+                low=to_price(low),
+                close=to_price(close),
+                volume=volume,
+                timestamp=timestamp
+            )
+            for open_, high, low, close, volume, timestamp in zip(
+                self.open.tolist(), self.high.tolist(), self.low.tolist(),
+                self.close.tolist(), self.volume.tolist(), timestamps
+            )
+        ]
+    
+    def to_ohlcv(self, to_price: Optional[Callable[[float], Decimal]] = None) -> List['OHLCV']:
+        """Convert to a list of OHLCV candles."""
+        if to_price is None:
+            to_price = lambda value: Decimal(repr(value))
+        
+        timestamps = self.ts.astype('datetime64[us]').tolist()
+        return [
+            OHLCV(
+                open=to_price(open_),
+                high=to_price(high),
+                low=to_price(low),
+                close=to_price(close),
+                volume=volume,
+                timestamp=timestamp
+            )
+            for open_, high, low, close, volume, timestamp in zip(
+                self.open.tolist(), self.high.tolist(), self.low.tolist(),
+                self.close.tolist(), self.volume.tolist(), timestamps
+            )
+        ]
+
+
+class OHLCVRingBuffer:
+    """
+    Fixed-capacity rolling window of OHLCV bars stored column-wise.
+    
+    Each bar is written twice (at slot and slot + capacity), so the most
+    recent bars always form one contiguous slice and view() never copies.
+    """
+    
+    def __init__(self, symbol: str, capacity: int):
+        self.symbol = symbol
+        self.capacity = capacity
+        self._ts = np.empty(2 * capacity, dtype='datetime64[ns]')
+        self._open = np.empty(2 * capacity, dtype=np.float64)
+        self._high = np.empty(2 * capacity, dtype=np.float64)
+        self._low = np.empty(2 * capacity, dtype=np.float64)
+        self._close = np.empty(2 * capacity, dtype=np.float64)
+        self._volume = np.empty(2 * capacity, dtype=np.int64)
+        self._cursor = 0  # Total bars appended
+    
+    def __len__(self) -> int:
+        return min(self._cursor, self.capacity)
+    
+    def append(self, timestamp: datetime, open_: float, high: float, low: float,
+               close: float, volume: int) -> None:
+        """Append a bar, overwriting the oldest one once full."""
+        slot = self._cursor % self.capacity
+        mirror = slot + self.capacity
+        self._ts[slot] = self._ts[mirror] = np.datetime64(timestamp, 'ns')
+        self._open[slot] = self._open[mirror] = open_
+        self._high[slot] = self._high[mirror] = high
+        self._low[slot] = self._low[mirror] = low
+        self._close[slot] = self._close[mirror] = close
+        self._volume[slot] = self._volume[mirror] = volume
+        self._cursor += 1
+    
+    def view(self) -> MarketDataFrame:
+        """Return the buffered bars, oldest first, as array views (no copy)."""
+        start = self._cursor % self.capacity if self._cursor >= self.capacity else 0
+        window = slice(start, start + len(self))
+        return MarketDataFrame(
+            symbol=self.symbol,
+            ts=self._ts[window],
+            open=self._open[window],
+            high=self._high[window],
+            low=self._low[window],
+            close=self._close[window],
+            volume=self._volume[window]
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class OHLCV:
-    """Represents OHLCV data."""
+    """Represents OHLCV data (immutable candle)."""
     open: Decimal = Decimal('0')
     high: Decimal = Decimal('0')
     low: Decimal = Decimal('0')
@@ -207,7 +318,7 @@ class Symbol:
     exchange: str = ""
     instrument_type: str = ""
     lot_size: int = 1
-    tick_size: Decimal = Decimal('0.01')
+    tick_size: float = 0.01  # Float is exact enough for 2-decimal ticks; keep Decimal for PnL
     is_active: bool = True
 
 
@@ -22,6 +22,10 @@ class LogHandler(ABC):
     def handle_log(self, level: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
         """Handle a log message."""
         pass
+    
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether this handler would emit a message at the given level."""
+        return True
 
 
 class FileLogHandler(LogHandler):
@@ -156,6 +160,10 @@ class ConsoleLogHandler(LogHandler):
         except Exception as e:
             # Fallback to stderr if logging fails
             print(f"Console logging failed: {str(e)}", file=sys.stderr)
+    
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether this handler would emit a message at the given level."""
+        return getattr(logging, level.upper(), logging.INFO) >= self.handler.level
 
 
 class TelegramLogHandler(LogHandler):
@@ -203,6 +211,10 @@ class TelegramLogHandler(LogHandler):
         except Exception as e:
             # Fallback to stderr if Telegram fails
             print(f"Telegram logging failed: {str(e)}", file=sys.stderr)
+    
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether this handler would emit a message at the given level."""
+        return self.enabled and level.upper() in ['ERROR', 'CRITICAL', 'WARNING']
 
 
 class LoggingService:
@@ -258,6 +270,15 @@ class LoggingService:
         if handler in self.handlers:
             self.handlers.remove(handler)
     
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Check whether any handler would emit a message at the given level.
+        
+        Lets hot paths skip building expensive log messages, e.g.
+        ``if logger.is_enabled_for('DEBUG'): logger.debug(f"...")``.
+        """
+        return any(handler.is_enabled_for(level) for handler in self.handlers)
+    
     def log(self, level: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
         """Log a message with the specified level and context."""
         timestamp = datetime.now().isoformat()
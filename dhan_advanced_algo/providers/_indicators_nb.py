@@ -0,0 +1,158 @@
+"""
+Numba-compiled indicator kernels for the strategy engine.
+Each kernel takes float64 arrays and reproduces the pandas formula the
+engine uses, so results match the pandas path, including how pandas
+treats missing (NaN) values.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: leaves the function as plain Python."""
+        def decorate(func):
+            return func
+        return decorate
+
+
+# error_model='numpy' makes x / 0 give inf/nan like pandas instead of raising.
+# fastmath is left off: it may reorder sums and shift signal thresholds.
+_JIT_OPTIONS = dict(cache=True, error_model='numpy')
+
+
+@njit(**_JIT_OPTIONS)
+def rolling_mean(values, window):
+    """
+    Trailing mean over `window` values, like pandas rolling(window).mean().
+
+    NaN until the window is full and while it holds a NaN. NaNs are counted
+    rather than summed, so the running total recovers once they leave.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    missing = 0
+    for i in range(n):
+        value = values[i]
+        if np.isnan(value):
+            missing += 1
+        else:
+            total += value
+        if i >= window:
+            old = values[i - window]
+            if np.isnan(old):
+                missing -= 1
+            else:
+                total -= old
+        if i >= window - 1 and missing == 0:
+            out[i] = total / window
+    return out
+
+
+@njit(**_JIT_OPTIONS)
+def ewm_mean(values, span):
+    """
+    Exponentially weighted mean matching pandas ewm(span=span).mean().
+
+    Follows pandas' adjusted recurrence: a NaN repeats the previous mean
+    (NaN before the first value) while older weights keep decaying.
+    """
+    n = values.shape[0]
+    out = np.empty(n)
+    decay = 1.0 - 2.0 / (span + 1.0)
+    weighted = np.nan
+    old_weight = 1.0
+    for i in range(n):
+        value = values[i]
+        if np.isnan(weighted):
+            weighted = value
+        else:
+            old_weight *= decay
+            if not np.isnan(value):
+                if weighted != value:
+                    weighted = (old_weight * weighted + value) / (old_weight + 1.0)
+                old_weight += 1.0
+        out[i] = weighted
+    return out
+
+
+@njit(**_JIT_OPTIONS)
+def rsi(close, period):
+    """RSI from simple rolling averages of gains and losses."""
+    n = close.shape[0]
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+    rs = rolling_mean(gains, period) / rolling_mean(losses, period)
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+@njit(**_JIT_OPTIONS)
+def macd(close, fast, slow, signal):
+    """MACD line and its signal line."""
+    line = ewm_mean(close, fast) - ewm_mean(close, slow)
+    return line, ewm_mean(line, signal)
+
+
+@njit(**_JIT_OPTIONS)
+def atr(high, low, close, period):
+    """Average True Range over simple rolling means of the true range."""
+    n = close.shape[0]
+    true_range = np.empty(n)
+    for i in range(n):
+        # Largest of the available ranges, skipping NaNs as pandas max does
+        value = high[i] - low[i]
+        if i > 0:
+            for candidate in (abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])):
+                if np.isnan(value) or candidate > value:
+                    value = candidate
+        true_range[i] = value
+    return rolling_mean(true_range, period)
+
+
+@njit(**_JIT_OPTIONS)
+def vwap(close, volume):
+    """
+    Cumulative volume-weighted average price.
+
+    Like pandas cumsum, NaNs are skipped by the running sums but stay NaN
+    at their own positions.
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    turnover = 0.0
+    total_volume = 0.0
+    for i in range(n):
+        traded = close[i] * volume[i]
+        if not np.isnan(traded):
+            turnover += traded
+        if not np.isnan(volume[i]):
+            total_volume += volume[i]
+        if np.isnan(traded) or np.isnan(volume[i]):
+            out[i] = np.nan
+        else:
+            out[i] = turnover / total_volume
+    return out
+
+
+def warmup() -> None:
+    """Compile every kernel up front so the first scan pays no JIT latency."""
+    if not NUMBA_AVAILABLE:
+        return
+
+    sample = np.linspace(1.0, 2.0, 40)
+    rolling_mean(sample, 5)
+    rsi(sample, 14)
+    macd(sample, 12, 26, 9)
+    atr(sample + 0.1, sample - 0.1, sample, 14)
+    vwap(sample, sample)
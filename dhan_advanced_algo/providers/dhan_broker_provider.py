@@ -3,6 +3,7 @@ Dhan broker provider implementation.
 Implements IBrokerProvider interface using Dhan API.
 """
 
+import threading
 import time
 from typing import Dict, Optional, List
 from decimal import Decimal
@@ -33,34 +34,41 @@ class DhanBrokerProvider(IBrokerProvider):
         self.logger = LoggingService()
         self.last_request_time = 0
         self.request_count = 0
+        self.window_start = 0
         self.max_requests_per_minute = 60
+        self._lock = threading.Lock()
         
         self.logger.info("Dhan Broker Provider initialized")
     
     def _rate_limit_check(self) -> None:
-        """Check and enforce rate limiting."""
-        current_time = time.time()
-        time_diff = current_time - self.last_request_time
+        """
+        Check and enforce rate limiting.
         
-        # Enforce minimum delay between requests
-        min_delay = self.config.broker.rate_limit_delay
-        if time_diff < min_delay:
-            sleep_time = min_delay - time_diff
-            time.sleep(sleep_time)
+        Safe to call from several threads: the next request slot is reserved
+        under a lock, and any required sleep happens after releasing it.
+        """
+        with self._lock:
+            current_time = time.time()
+            
+            # Enforce minimum delay between requests
+            slot_time = max(current_time, self.last_request_time + self.config.broker.rate_limit_delay)
+            
+            # Check requests per minute limit
+            if slot_time - self.window_start >= 60:  # Reset counter after 1 minute
+                self.request_count = 0
+                self.window_start = slot_time
+            elif self.request_count >= self.max_requests_per_minute:
+                slot_time = self.window_start + 60
+                self.logger.warning(f"Rate limit reached, sleeping for {slot_time - current_time:.2f} seconds")
+                self.request_count = 0
+                self.window_start = slot_time
+            
+            self.request_count += 1
+            self.last_request_time = slot_time
         
-        # Check requests per minute limit
-        if time_diff >= 60:  # Reset counter after 1 minute
-            self.request_count = 0
-            self.last_request_time = current_time
-        elif self.request_count >= self.max_requests_per_minute:
-            sleep_time = 60 - time_diff
-            self.logger.warning(f"Rate limit reached, sleeping for {sleep_time:.2f} seconds")
+        sleep_time = slot_time - current_time
+        if sleep_time > 0:
             time.sleep(sleep_time)
-            self.request_count = 0
-            self.last_request_time = time.time()
-        
-        self.request_count += 1
-        self.last_request_time = time.time()
     
     def place_order(self, order) -> str:
         """
@@ -222,17 +230,18 @@ class DhanBrokerProvider(IBrokerProvider):
             if not response:
                 return []
             
-            # Convert to standard format
-            positions = []
-            for pos in response:
-                position = {
+            # Convert to standard format (one timestamp for the whole snapshot)
+            now = datetime.now()
+            positions = [
+                {
                     'symbol': pos.get('symbol'),
                     'quantity': int(pos.get('quantity', 0)),
                     'average_price': Decimal(str(pos.get('averagePrice', 0))),
                     'side': pos.get('side', 'BUY'),
-                    'timestamp': datetime.now()
+                    'timestamp': now
                 }
-                positions.append(position)
+                for pos in response
+            ]
             
             self.logger.debug(f"Retrieved {len(positions)} positions")
             return positions
@@ -269,18 +278,19 @@ class DhanBrokerProvider(IBrokerProvider):
                 return []
             
             # Convert to standard format
-            orders = []
-            for order in response:
-                order_info = {
+            now = datetime.now()
+            orders = [
+                {
                     'order_id': order.get('orderId'),
                     'symbol': order.get('symbol'),
                     'side': order.get('side'),
                     'quantity': int(order.get('quantity', 0)),
                     'price': Decimal(str(order.get('price', 0))),
                     'status': order.get('status'),
-                    'timestamp': datetime.fromisoformat(order.get('timestamp', datetime.now().isoformat()))
+                    'timestamp': datetime.fromisoformat(order['timestamp']) if 'timestamp' in order else now
                 }
-                orders.append(order_info)
+                for order in response
+            ]
             
             self.logger.debug(f"Retrieved {len(orders)} orders from history")
             return orders
@@ -317,18 +327,19 @@ class DhanBrokerProvider(IBrokerProvider):
                 return []
             
             # Convert to standard format
-            trades = []
-            for trade in response:
-                trade_info = {
+            now = datetime.now()
+            trades = [
+                {
                     'trade_id': trade.get('tradeId'),
                     'order_id': trade.get('orderId'),
                     'symbol': trade.get('symbol'),
                     'side': trade.get('side'),
                     'quantity': int(trade.get('quantity', 0)),
                     'price': Decimal(str(trade.get('price', 0))),
-                    'timestamp': datetime.fromisoformat(trade.get('timestamp', datetime.now().isoformat()))
+                    'timestamp': datetime.fromisoformat(trade['timestamp']) if 'timestamp' in trade else now
                 }
-                trades.append(trade_info)
+                for trade in response
+            ]
             
             self.logger.debug(f"Retrieved {len(trades)} trades from history")
             return trades
@@ -3,26 +3,141 @@ Dhan market data provider implementation.
 Implements IMarketDataProvider interface using Dhan API.
 """
 
+import asyncio
+import bisect
+import json
+import os
+import re
 import time
+import threading
 import requests
-from typing import List, Optional, Dict
+import numpy as np
+import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, TimeoutError as FutureTimeout, as_completed
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Dict, Set, Tuple
 from decimal import Decimal
-from datetime import datetime, timedelta
+from datetime import datetime
+from email.utils import parsedate_to_datetime
 
 from ..core.interfaces import IMarketDataProvider
-from ..core.entities import MarketData
+from ..core.entities import MarketData, MarketDataFrame, OHLCVRingBuffer
 from ..core.exceptions import MarketDataException, RateLimitException, ConnectionException
 from ..core.logging_service import LoggingService
 from ..core.config import ConfigurationManager
 
 
+# Fallback message classifier for untyped client errors: group 1 -> rate limit, group 2 -> connection problem
+_ERR_PAT = re.compile(r"(rate limit|too many requests)|(connection|timeout)", re.IGNORECASE)
+
+# Untyped errors that should trigger limiter backoff (also matches a bare HTTP 429 status)
+_RATE_LIMIT_PAT = re.compile(r"rate limit|too many requests|429", re.IGNORECASE)
+
+# Phase for each interval between the boundaries built in _refresh_market_times
+_PHASE_NAMES = ("MARKET_CLOSED", "PRE_MARKET", "MARKET_OPEN", "POST_MARKET", "MARKET_CLOSED")
+
+# Longest a caller waits on another thread's LTP fetch before fetching itself
+_INFLIGHT_JOIN_TIMEOUT = 10.0
+
+# Maximum instruments per multi-instrument market feed request
+_LTP_BATCH_SIZE = 1000
+
+# After a failed scrip master download or batch LTP request, wait this long
+# before trying again instead of paying for the failure on every call
+_SCRIP_MASTER_RETRY_SECONDS = 300.0
+_LTP_BATCH_RETRY_SECONDS = 300.0
+
+# Spot-checked after each scrip master refresh
+_MAJOR_STOCKS = ("RELIANCE", "TCS", "HDFC", "INFY", "ICICIBANK", "HINDUNILVR", "ITC", "SBIN",
+				 "BHARTIARTL", "AXISBANK", "ASIANPAINT", "MARUTI", "HCLTECH", "ULTRACEMCO")
+
+_CANDLE_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+_TICK = Decimal("0.05")
+_TICK_FLOAT = 0.05
+
+
+@lru_cache(maxsize=4096)
+def _price_from_ticks(ticks: int) -> Decimal:
+	"""Decimal price for a whole number of ticks (shared immutable instances)."""
+	return _TICK * ticks
+
+
+def _http_status(error: Exception) -> Optional[int]:
+	"""HTTP status code carried by a requests HTTPError, if any."""
+	if isinstance(error, requests.HTTPError) and error.response is not None:
+		return error.response.status_code
+	return None
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+	"""Classify by exception type or status code, falling back to the message for untyped errors."""
+	if isinstance(error, RateLimitException):
+		return True
+	if isinstance(error, requests.RequestException):
+		return _http_status(error) == 429
+	return bool(_RATE_LIMIT_PAT.search(str(error)))
+
+
+def _retry_after_seconds(error: Optional[Exception]) -> Optional[float]:
+	"""
+	Server-advised wait from a 429 response's Retry-After or X-RateLimit-Reset header.
+	
+	Retry-After may be delta seconds or an HTTP date; X-RateLimit-Reset may be
+	an epoch timestamp or delta seconds. Returns None when neither is usable.
+	"""
+	response = getattr(error, "response", None)
+	headers = getattr(response, "headers", None)
+	if not headers:
+		return None
+	
+	retry_after = headers.get("Retry-After")
+	if retry_after:
+		try:
+			return max(0.0, float(retry_after))
+		except ValueError:
+			try:
+				return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+			except (TypeError, ValueError):
+				pass
+	
+	reset = headers.get("X-RateLimit-Reset")
+	if reset:
+		try:
+			reset = float(reset)
+		except ValueError:
+			return None
+		# Large values are epoch timestamps, small ones are already a delay
+		return max(0.0, reset - time.time()) if reset > 1e9 else max(0.0, reset)
+	return None
+
+
+def _to_minutes(hhmm: str) -> int:
+	"""Convert an "HH:MM" config time to minutes since midnight."""
+	hours, minutes = hhmm.split(":")
+	return int(hours) * 60 + int(minutes)
+
+
+def _to_price(value: float) -> Decimal:
+	"""Convert an API price to Decimal, reusing cached values for tick-aligned prices."""
+	ticks = round(value / _TICK_FLOAT)
+	# Only float rounding noise counts as on-grid, so the tolerance scales
+	# with the price; a fixed one would snap tiny off-grid values to a tick
+	if abs(ticks * _TICK_FLOAT - value) <= 1e-9 * abs(value):
+		return _price_from_ticks(ticks)
+	return Decimal(repr(value))
+
+
 class DhanMarketDataProvider(IMarketDataProvider):
 	"""
 	Dhan market data provider implementation.
 	Handles market data fetching from Dhan API with rate limiting and error handling.
 	"""
 	
-	def __init__(self, tsl_client, config):
+	def __init__(self, tsl_client: Any, config: ConfigurationManager) -> None:
 		"""
 		Initialize Dhan market data provider.
 		
@@ -33,70 +148,215 @@ class DhanMarketDataProvider(IMarketDataProvider):
 		self.tsl_client = tsl_client
 		self.config = config
 		self.logger = LoggingService()
-		self.last_request_time = 0
-		self.request_count = 0
 		self.max_requests_per_minute = 30  # Reduced from 60 to be more conservative
 		self.consecutive_429_errors = 0  # Track consecutive rate limit errors
 		self.backoff_multiplier = 1.0  # Exponential backoff multiplier
 		
+		# Sliding window: monotonic_ns timestamps of requests made in the last 60s
+		self._req_times: deque = deque()
+		self._last_backoff_decay_ns = time.monotonic_ns()
+		self._rate_lock = threading.Lock()
+		
+		# Worker pool for concurrent per-symbol requests (bulk LTP fan-out)
+		self._executor = ThreadPoolExecutor(
+			max_workers=self.config.broker.bulk_concurrency or 8,
+			thread_name_prefix="dhan-market-data"
+		)
+		
+		# Stale-while-revalidate LTP refreshes get their own pool: callers on
+		# _executor may block joining a refresh, which must never queue behind them
+		self._refresh_executor = ThreadPoolExecutor(
+			max_workers=2,
+			thread_name_prefix="dhan-ltp-refresh"
+		)
+		
+		self._configure_http_session()
+		
+		# Provider-owned session for direct, unauthenticated downloads (scrip master)
+		self._http = requests.Session()
+		self._http.mount("https://", HTTPAdapter(
+			pool_connections=10,
+			pool_maxsize=20,
+			max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+		))
+		
+		# LTP cache: symbol -> (ltp, monotonic fetch time), least recently used first.
+		# Prices are kept as floats; Decimal is only built when returned from get_ltp.
+		self._ltp_cache: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+		self._ltp_cache_lock = threading.Lock()
+		self._inflight: Dict[str, Future] = {}  # symbol -> fetch in progress, shared by concurrent callers
+		self._last_market_phase = None
+		
+		# Symbol metadata caches, dropped on market close or configuration reload
+		self._symbol_info_cache: Dict[str, Dict] = {}
+		self._valid_symbols: Set[str] = set()
+		self._invalid_symbols: Dict[str, float] = {}  # symbol -> monotonic time it failed validation
+		self._symbol_cache_version = self.config.config_version
+		
+		# Rolling per-symbol bar windows, preallocated so ingestion never allocates
+		self._bar_buffers: Dict[str, OHLCVRingBuffer] = {}
+		
+		# Parsed market-hour boundaries, re-parsed only when the config strings change
+		self._market_times_key = None
+		self._refresh_market_times()
+		
 		# Cache for scrip master mapping
 		self._scrip_master_cache = {}
 		self._scrip_master_cache_time = 0
 		self._cache_validity_hours = 24  # Cache for 24 hours
+		self._scrip_master_lock = threading.Lock()
+		self._scrip_master_inflight: Optional[Future] = None  # Download shared by concurrent callers
+		self._scrip_master_failed_at = float("-inf")  # Monotonic time of the last failed download
+		self._ltp_batch_failed_at = float("-inf")  # Monotonic time the batch LTP endpoint last failed
+		self._secid: Dict[str, str] = {}  # Resolved security IDs, flushed when the scrip master is rebuilt
 		
 		self.logger.info("Dhan Market Data Provider initialized")
 	
+	def _configure_http_session(self) -> None:
+		"""
+		Size the client's HTTP connection pool for concurrent requests.
+		
+		Only applies when the TSL client exposes a requests.Session; each
+		bulk worker then reuses a pooled keep-alive connection.
+		"""
+		session = getattr(self.tsl_client, 'session', None)
+		if not isinstance(session, requests.Session):
+			return
+		
+		adapter = HTTPAdapter(
+			pool_connections=8,
+			pool_maxsize=max(32, self.config.broker.bulk_concurrency or 8),
+			max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+		)
+		session.mount("https://", adapter)
+		session.mount("http://", adapter)
+		session.headers.update({
+			"Connection": "keep-alive",
+			"Accept-Encoding": "gzip"
+		})
+	
+	def close(self) -> None:
+		"""
+		Release the provider's worker pool and its own HTTP session.
+		
+		The TSL client's session belongs to the caller and is left open.
+		"""
+		self._executor.shutdown(wait=False, cancel_futures=True)
+		self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+		self._http.close()
+	
 	def _rate_limit_check(self) -> None:
-		"""Check and enforce rate limiting with intelligent backoff."""
-		current_time = time.time()
-		time_diff = current_time - self.last_request_time
-		
-		# Apply exponential backoff if we've had recent 429 errors
-		effective_delay = self.config.broker.rate_limit_delay * self.backoff_multiplier
-		
-		# Enforce minimum delay between requests
-		if time_diff < effective_delay:
-			sleep_time = effective_delay - time_diff
-			time.sleep(sleep_time)
-		
-		# Check requests per minute limit
-		if time_diff >= 60:  # Reset counter after 1 minute
-			self.request_count = 0
-			self.last_request_time = current_time
+		"""
+		Check and enforce rate limiting with intelligent backoff.
+		
+		At most max_requests_per_minute requests are allowed in any rolling
+		60s window; callers only sleep when the window is full (or, after
+		429 errors, to keep a minimum gap), and never while holding the lock.
+		"""
+		while True:
+			wait_ns = self._reserve_request_slot()
+			if not wait_ns:
+				return
+			
+			if self.logger.is_enabled_for('DEBUG'):
+				self.logger.debug(f"Rate limit reached, waiting {wait_ns / 1e9:.2f} seconds for a request slot")
+			time.sleep(wait_ns / 1e9)
+	
+	async def _arate_limit_check(self) -> None:
+		"""
+		Async variant of _rate_limit_check sharing the same request window.
+		
+		Waits with asyncio.sleep, so neither the event loop nor a worker
+		thread is held while the window is full.
+		"""
+		while True:
+			wait_ns = self._reserve_request_slot()
+			if not wait_ns:
+				return
+			
+			if self.logger.is_enabled_for('DEBUG'):
+				self.logger.debug(f"Rate limit reached, waiting {wait_ns / 1e9:.2f} seconds for a request slot")
+			await asyncio.sleep(wait_ns / 1e9)
+	
+	def _reserve_request_slot(self) -> int:
+		"""
+		Try to reserve a request slot in the sliding window without blocking.
+		
+		Returns:
+			0 if a slot was reserved, otherwise nanoseconds until one is available
+		"""
+		with self._rate_lock:
+			now_ns = time.monotonic_ns()
+			
 			# Gradually reduce backoff if no recent errors
-			if self.consecutive_429_errors > 0:
+			if self.consecutive_429_errors > 0 and now_ns - self._last_backoff_decay_ns >= 60_000_000_000:
 				self.consecutive_429_errors = max(0, self.consecutive_429_errors - 1)
 				self.backoff_multiplier = max(1.0, self.backoff_multiplier * 0.9)
-		elif self.request_count >= self.max_requests_per_minute:
-			sleep_time = 60 - time_diff
-			self.logger.warning(f"Rate limit reached, sleeping for {sleep_time:.2f} seconds")
-			time.sleep(sleep_time)
-			self.request_count = 0
-			self.last_request_time = time.time()
-		
-		self.request_count += 1
-		self.last_request_time = time.time()
-	
-	def _handle_rate_limit_error(self) -> None:
-		"""Handle rate limit errors with exponential backoff."""
+				self._last_backoff_decay_ns = now_ns
+			
+			# Drop requests that have left the 60s window
+			window_start_ns = now_ns - 60_000_000_000
+			while self._req_times and self._req_times[0] <= window_start_ns:
+				self._req_times.popleft()
+			
+			if len(self._req_times) >= self.max_requests_per_minute:
+				return self._req_times[0] - window_start_ns
+			
+			# After 429 errors, also keep an adaptive minimum gap between requests
+			if self.consecutive_429_errors > 0 and self._req_times:
+				min_gap_ns = int(self.config.broker.rate_limit_delay * self.backoff_multiplier * 1e9)
+				elapsed_ns = now_ns - self._req_times[-1]
+				if elapsed_ns < min_gap_ns:
+					return min_gap_ns - elapsed_ns
+			
+			self._req_times.append(now_ns)
+			return 0
+	
+	def _handle_rate_limit_error(self, error: Optional[Exception] = None) -> None:
+		"""
+		Handle rate limit errors, sleeping for the server-advised delay when the
+		response carries one and falling back to exponential backoff otherwise.
+		"""
 		self.consecutive_429_errors += 1
 		self.backoff_multiplier = min(5.0, 1.0 + (self.consecutive_429_errors * 0.5))
+		self._last_backoff_decay_ns = time.monotonic_ns()
 		
-		# Force a longer sleep for rate limit errors
-		backoff_sleep = self.config.broker.rate_limit_delay * self.backoff_multiplier
-		self.logger.warning(f"Rate limit error detected. Applying {backoff_sleep:.1f}s delay (backoff: {self.backoff_multiplier:.1f}x)")
+		advised = _retry_after_seconds(error)
+		if advised is not None:
+			# Bounded by the limiter window so a bogus header cannot stall a worker
+			backoff_sleep = min(advised, 60.0)
+			self.logger.warning(f"Rate limit error detected. Server asked to retry after {backoff_sleep:.1f}s")
+		else:
+			# Force a longer sleep for rate limit errors
+			backoff_sleep = self.config.broker.rate_limit_delay * self.backoff_multiplier
+			self.logger.warning(f"Rate limit error detected. Applying {backoff_sleep:.1f}s delay (backoff: {self.backoff_multiplier:.1f}x)")
 		time.sleep(backoff_sleep)
 	
 	def _handle_api_error(self, error: Exception, operation: str) -> None:
 		"""Handle API errors and raise appropriate exceptions."""
-		error_msg = str(error).lower()
+		error_msg = str(error)
+		
+		# Dispatch on exception type and HTTP status first
+		if isinstance(error, RateLimitException):
+			raise RateLimitException(f"Rate limit exceeded during {operation}: {error_msg}")
+		if isinstance(error, (requests.Timeout, requests.ConnectionError, ConnectionException)):
+			raise ConnectionException(f"Connection error during {operation}: {error_msg}")
+		if isinstance(error, requests.RequestException):
+			status = _http_status(error)
+			if status == 429:
+				raise RateLimitException(f"Rate limit exceeded during {operation}: {error_msg}")
+			if status is not None and status >= 500:
+				raise ConnectionException(f"Connection error during {operation}: {error_msg}")
+			raise MarketDataException(f"API error during {operation}: {error_msg}")
 		
-		if "rate limit" in error_msg or "too many requests" in error_msg:
-			raise RateLimitException(f"Rate limit exceeded during {operation}: {str(error)}")
-		elif "connection" in error_msg or "timeout" in error_msg:
-			raise ConnectionException(f"Connection error during {operation}: {str(error)}")
+		# Clients that only raise generic exceptions are classified by message
+		match = _ERR_PAT.search(error_msg)
+		if match and match.group(1):
+			raise RateLimitException(f"Rate limit exceeded during {operation}: {error_msg}")
+		elif match and match.group(2):
+			raise ConnectionException(f"Connection error during {operation}: {error_msg}")
 		else:
-			raise MarketDataException(f"API error during {operation}: {str(error)}")
+			raise MarketDataException(f"API error during {operation}: {error_msg}")
 	
 	def get_ltp(self, symbol: str) -> Optional[Decimal]:
 		"""
@@ -113,10 +373,128 @@ class DhanMarketDataProvider(IMarketDataProvider):
 			RateLimitException: If rate limit exceeded
 			ConnectionException: If connection fails
 		"""
+		ltp = self.get_ltp_float(symbol)
+		return None if ltp is None else _to_price(ltp)
+	
+	def get_ltp_float(self, symbol: str) -> Optional[float]:
+		"""
+		Get Last Traded Price for a symbol as a float.
+		
+		Cheaper than get_ltp for strategies and indicators that work in floats.
+		Recently fetched prices are served from an in-memory cache. Within
+		ltp_cache_ttl the cached price is returned as is; up to
+		ltp_cache_stale_ttl the stale price is returned while a background
+		refresh runs; older entries are fetched synchronously. Concurrent
+		callers for the same symbol share a single outbound request, waiting
+		at most _INFLIGHT_JOIN_TIMEOUT for it before fetching on their own.
+		
+		Args:
+			symbol: Trading symbol
+			
+		Returns:
+			Last traded price or None if failed
+			
+		Raises:
+			MarketDataException: If API call fails
+			RateLimitException: If rate limit exceeded
+			ConnectionException: If connection fails
+		"""
+		with self._ltp_cache_lock:
+			entry = self._ltp_cache.get(symbol)
+			if entry is not None:
+				ltp, fetched_at = entry
+				age = time.monotonic() - fetched_at
+				
+				if age < self.config.broker.ltp_cache_ttl:
+					self._ltp_cache.move_to_end(symbol)
+					return ltp
+				
+				if age < self.config.broker.ltp_cache_stale_ttl:
+					# Serve the stale price and refresh it in the background
+					if symbol not in self._inflight:
+						self._inflight[symbol] = self._refresh_executor.submit(self._refresh_ltp, symbol)
+					return ltp
+			
+			# Join a fetch already in flight for this symbol, or start one
+			future = self._inflight.get(symbol)
+			is_owner = future is None
+			if is_owner:
+				future = Future()
+				self._inflight[symbol] = future
+		
+		if not is_owner:
+			try:
+				return future.result(timeout=_INFLIGHT_JOIN_TIMEOUT)
+			except (FutureTimeout, CancelledError):
+				# The shared fetch is stuck or was cancelled at shutdown
+				return self._fetch_ltp(symbol)
+		
+		try:
+			ltp = self._fetch_ltp(symbol)
+			future.set_result(ltp)
+			return ltp
+		except Exception as e:
+			future.set_exception(e)
+			raise
+		finally:
+			with self._ltp_cache_lock:
+				self._inflight.pop(symbol, None)
+	
+	def _refresh_ltp(self, symbol: str) -> Optional[float]:
+		"""Refresh a cached LTP in the background (runs on a worker thread)."""
+		try:
+			return self._fetch_ltp(symbol)
+		except Exception as e:
+			self.logger.warning(f"Background LTP refresh failed for {symbol}: {e}")
+			return None
+		finally:
+			with self._ltp_cache_lock:
+				self._inflight.pop(symbol, None)
+	
+	def _store_ltp(self, symbol: str, ltp: float) -> None:
+		"""Insert an LTP into the cache, evicting least recently used entries."""
+		with self._ltp_cache_lock:
+			self._ltp_cache[symbol] = (ltp, time.monotonic())
+			self._ltp_cache.move_to_end(symbol)
+			while len(self._ltp_cache) > self.config.broker.ltp_cache_size:
+				self._ltp_cache.popitem(last=False)
+	
+	def invalidate_ltp(self, symbol: str) -> None:
+		"""
+		Drop a symbol's cached LTP so the next get_ltp fetches a fresh price.
+		
+		Call this on events that are known to move the price, e.g. an order fill.
+		
+		Args:
+			symbol: Trading symbol
+		"""
+		with self._ltp_cache_lock:
+			self._ltp_cache.pop(symbol, None)
+	
+	def _clear_ltp_cache(self) -> None:
+		"""Drop all cached LTPs."""
+		with self._ltp_cache_lock:
+			self._ltp_cache.clear()
+	
+	def _sync_symbol_caches(self) -> None:
+		"""Drop symbol metadata cached under an older configuration version."""
+		if self.config.config_version != self._symbol_cache_version:
+			self._clear_symbol_caches()
+			self._symbol_cache_version = self.config.config_version
+	
+	def _clear_symbol_caches(self) -> None:
+		"""Drop cached symbol info and validation results."""
+		self._symbol_info_cache.clear()
+		self._valid_symbols.clear()
+		self._invalid_symbols.clear()
+	
+	def _fetch_ltp(self, symbol: str) -> Optional[float]:
+		"""Fetch the LTP for a symbol from the API and cache it."""
 		try:
 			self._rate_limit_check()
 			
-			self.logger.debug(f"Fetching LTP for symbol: {symbol}")
+			if self.logger.is_enabled_for('DEBUG'):
+				self.logger.debug(f"Fetching LTP for symbol: {symbol}")
 			
 			# Use Dhan service to get market data
 			market_data = self.tsl_client.get_market_data(symbol)
@@ -131,10 +509,12 @@ class DhanMarketDataProvider(IMarketDataProvider):
 				self.logger.warning(f"Invalid LTP value for symbol {symbol}: {ltp_value}")
 				return None
 			
-			ltp_decimal = Decimal(str(ltp_value))
-			self.logger.debug(f"LTP for {symbol}: {ltp_decimal}")
+			ltp = float(ltp_value)
+			if self.logger.is_enabled_for('DEBUG'):
+				self.logger.debug(f"LTP for {symbol}: {ltp}")
 			
-			return ltp_decimal
+			self._store_ltp(symbol, ltp)
+			return ltp
 			
 		except Exception as e:
 			self.logger.error(f"Failed to get LTP for {symbol}: {str(e)}")
@@ -160,10 +540,10 @@ class DhanMarketDataProvider(IMarketDataProvider):
 			market_data = MarketData(
 				symbol=symbol,
 				ltp=ltp,
-				open_price=ltp,  # Use LTP as fallback
-				high_price=ltp,
-				low_price=ltp,
-				close_price=ltp,
+				open=ltp,  # Use LTP as fallback
+				high=ltp,
+				low=ltp,
+				close=ltp,
 				volume=0,  # Not available from LTP
 				timestamp=datetime.now()
 			)
@@ -186,11 +566,27 @@ class DhanMarketDataProvider(IMarketDataProvider):
 			interval: Time interval (1D, 1H, 15M, etc.)
 			limit: Number of candles to fetch
 			
+		Returns:
+			List of OHLCV data dictionaries
+		"""
+		return self._fetch_ohlcv(symbol, interval, limit)
+	
+	def _fetch_ohlcv(self, symbol: str, interval: str = "1D", limit: int = 100, throttle: bool = True) -> List:
+		"""
+		Fetch OHLCV candles from the API.
+		
+		Args:
+			symbol: Trading symbol
+			interval: Time interval (1D, 1H, 15M, etc.)
+			limit: Number of candles to fetch
+			throttle: Reserve a rate-limit slot first (False when the caller already has one)
+			
 		Returns:
 			List of OHLCV data dictionaries
 		"""
 		try:
-			self._rate_limit_check()
+			if throttle:
+				self._rate_limit_check()
 			
 			# Get security ID from scrip master
 			security_id = self._get_security_id(symbol)
@@ -228,41 +624,37 @@ class DhanMarketDataProvider(IMarketDataProvider):
 			if not all([opens, highs, lows, closes, volumes, timestamps]):
 				return []
 			
-			# Build OHLCV candles
-			candles = []
-			for i in range(min(len(opens), limit)):
-				try:
-					# Handle different timestamp formats
-					timestamp = timestamps[i]
-					if isinstance(timestamp, (int, float)):
-						# Convert epoch timestamp to ISO format
-						from datetime import datetime
-						timestamp = datetime.fromtimestamp(timestamp / 1000).isoformat()
-					
-					candle = {
-						"timestamp": timestamp,
-						"open": float(opens[i]),
-						"high": float(highs[i]),
-						"low": float(lows[i]),
-						"close": float(closes[i]),
-						"volume": int(volumes[i])
-					}
-					candles.append(candle)
-				except (ValueError, IndexError) as e:
-					self.logger.log_error(e, {
-						"operation": "parse_ohlcv_candle",
-						"symbol": symbol,
-						"index": i
-					})
-					continue
+			# Convert each column once instead of per candle
+			count = min(len(opens), len(highs), len(lows), len(closes), len(volumes), len(timestamps), limit)
+			try:
+				o = np.asarray(opens[:count], dtype=np.float64)
+				h = np.asarray(highs[:count], dtype=np.float64)
+				lo = np.asarray(lows[:count], dtype=np.float64)
+				c = np.asarray(closes[:count], dtype=np.float64)
+				v = np.asarray(volumes[:count], dtype=np.float64).astype(np.int64)
+				
+				ts = timestamps[:count]
+				if isinstance(ts[0], (int, float)):
+					# Epoch milliseconds to local-time ISO strings
+					utc_offset_ms = datetime.now().astimezone().utcoffset().total_seconds() * 1000
+					local_ms = np.asarray(ts, dtype=np.float64) + utc_offset_ms
+					ts = np.datetime_as_string(local_ms.astype("datetime64[ms]"), unit="s").tolist()
+			except (ValueError, TypeError) as e:
+				self.logger.log_error(e, {
+					"operation": "parse_ohlcv_candles",
+					"symbol": symbol
+				})
+				return []
 			
-			return candles
+			return [
+				{"timestamp": t, "open": op, "high": hi, "low": low, "close": cl, "volume": vol}
+				for t, op, hi, low, cl, vol in zip(ts, o.tolist(), h.tolist(), lo.tolist(), c.tolist(), v.tolist())
+			]
 			
 		except Exception as e:
 			# Check if it's a rate limit error and handle accordingly
-			error_msg = str(e).lower()
-			if "rate limit" in error_msg or "429" in error_msg or "too many requests" in error_msg:
-				self._handle_rate_limit_error()
+			if _is_rate_limit_error(e):
+				self._handle_rate_limit_error(e)
 			else:
 				self.logger.log_error(e, {
 					"operation": "get_ohlcv",
@@ -286,40 +678,143 @@ class DhanMarketDataProvider(IMarketDataProvider):
 			RateLimitException: If rate limit exceeded
 			ConnectionException: If connection fails
 		"""
-		try:
-			self._rate_limit_check()
+		return {symbol: _to_price(ltp) for symbol, ltp in self.get_ltp_bulk_float(symbols).items()}
+	
+	def get_ltp_bulk_float(self, symbols: List[str]) -> Dict[str, float]:
+		"""
+		Get LTP for multiple symbols in bulk, as floats.
+		
+		Args:
+			symbols: List of trading symbols
 			
+		Returns:
+			Dictionary mapping symbols to their LTP values
+			
+		Raises:
+			MarketDataException: If API call fails
+			RateLimitException: If rate limit exceeded
+			ConnectionException: If connection fails
+		"""
+		try:
 			if not symbols:
 				return {}
 			
-			self.logger.debug(f"Fetching bulk LTP for {len(symbols)} symbols")
+			if self.logger.is_enabled_for('DEBUG'):
+				self.logger.debug(f"Fetching bulk LTP for {len(symbols)} symbols")
 			
-			# Get market data for each symbol (no bulk method available)
-			result = {}
-			for symbol in symbols:
+			# One request per batch of instruments where the market feed supports it
+			result = self._fetch_ltp_batch(symbols)
+			
+			# Fall back to one request per remaining symbol, each worker
+			# passing through the shared rate limiter
+			futures = {
+				self._executor.submit(self._fetch_bulk_ltp, symbol): symbol
+				for symbol in symbols if symbol not in result
+			}
+			
+			for future in as_completed(futures):
+				symbol = futures[future]
 				try:
-					market_data = self.tsl_client.get_market_data(symbol)
-					if market_data and "lastPrice" in market_data:
-						ltp_value = market_data["lastPrice"]
-						if ltp_value > 0:
-							result[symbol] = Decimal(str(ltp_value))
-						else:
-							self.logger.warning(f"Invalid LTP value for symbol {symbol}: {ltp_value}")
-					else:
-						self.logger.warning(f"No market data for symbol: {symbol}")
+					ltp = future.result()
 				except Exception as e:
 					self.logger.warning(f"Failed to get LTP for {symbol}: {e}")
-					
-				# Rate limiting for individual calls
-				time.sleep(self.config.broker.rate_limit_delay)  # Use configured delay instead of hardcoded 0.1
+					continue
+				
+				if ltp is not None:
+					result[symbol] = ltp
 			
-			self.logger.debug(f"Bulk LTP fetched successfully for {len(result)} symbols")
+			if self.logger.is_enabled_for('DEBUG'):
+				self.logger.debug(f"Bulk LTP fetched successfully for {len(result)} symbols")
 			return result
 			
 		except Exception as e:
 			self.logger.error(f"Failed to get bulk LTP: {str(e)}")
 			self._handle_api_error(e, "get_ltp_bulk")
 	
+	def _fetch_ltp_batch(self, symbols: List[str]) -> Dict[str, float]:
+		"""
+		Fetch LTPs through the multi-instrument market feed endpoint.
+		
+		Symbols are resolved to NSE security IDs and sent up to
+		_LTP_BATCH_SIZE per request. Symbols missing from the result are
+		left for the caller to fetch individually. Security IDs are resolved
+		before any rate-limit slot is taken, and after a failed request the
+		endpoint is skipped for _LTP_BATCH_RETRY_SECONDS, so the fallback
+		does not pay for batch attempts that cannot succeed.
+		"""
+		result = {}
+		if time.monotonic() - self._ltp_batch_failed_at < _LTP_BATCH_RETRY_SECONDS:
+			return result
+		
+		try:
+			scrip_master = self._fetch_scrip_master()
+			symbol_by_security_id = {
+				scrip_master[symbol]: symbol for symbol in symbols if symbol in scrip_master
+			}
+			security_ids = list(symbol_by_security_id)
+			
+			for start in range(0, len(security_ids), _LTP_BATCH_SIZE):
+				batch = security_ids[start:start + _LTP_BATCH_SIZE]
+				self._rate_limit_check()
+				
+				response = self.tsl_client._make_request(
+					"/marketfeed/ltp", method="POST", data={"NSE_EQ": [int(security_id) for security_id in batch]}
+				)
+				if not response or not isinstance(response, dict):
+					raise MarketDataException(f"Unexpected batch LTP response: {type(response).__name__}")
+				
+				quotes = response.get("data", {}).get("NSE_EQ", {})
+				for security_id, quote in quotes.items():
+					symbol = symbol_by_security_id.get(str(security_id))
+					ltp_value = quote.get("last_price") if isinstance(quote, dict) else None
+					if symbol and ltp_value and ltp_value > 0:
+						result[symbol] = float(ltp_value)
+			
+		except Exception as e:
+			self._ltp_batch_failed_at = time.monotonic()
+			self.logger.warning(f"Batch LTP request failed, falling back to per-symbol requests: {str(e)}")
+		
+		return result
+	
+	def _fetch_bulk_ltp(self, symbol: str, throttle: bool = True) -> Optional[float]:
+		"""Fetch a single symbol's LTP for get_ltp_bulk (runs on a worker thread)."""
+		if throttle:
+			self._rate_limit_check()
+		
+		try:
+			market_data = self.tsl_client.get_market_data(symbol)
+		except Exception as e:
+			# Back off the shared limiter so the other workers slow down too
+			if _is_rate_limit_error(e):
+				self._handle_rate_limit_error(e)
+			raise
+		
+		if not market_data or "lastPrice" not in market_data:
+			self.logger.warning(f"No market data for symbol: {symbol}")
+			return None
+		
+		ltp_value = market_data["lastPrice"]
+		if ltp_value is None or ltp_value <= 0:
+			self.logger.warning(f"Invalid LTP value for symbol {symbol}: {ltp_value}")
+			return None
+		
+		return float(ltp_value)
+	
+	def get_ltp_bulk_frame(self, symbols: List[str]) -> Tuple[List[str], np.ndarray]:
+		"""
+		Get LTP for multiple symbols as a float64 array.
+		
+		Args:
+			symbols: List of trading symbols
+			
+		Returns:
+			Tuple of (symbols that returned a price, aligned array of prices)
+		"""
+		ltps = self.get_ltp_bulk_float(symbols)
+		names = list(ltps)
+		prices = np.fromiter(ltps.values(), dtype=np.float64, count=len(names))
+		return names, prices
+	
 	def get_historical_data(self, symbol: str, timeframe: str, count: int) -> List[MarketData]:
 		"""
 		Get historical market data for a symbol.
@@ -338,51 +833,202 @@ class DhanMarketDataProvider(IMarketDataProvider):
 			ConnectionException: If connection fails
 		"""
 		try:
-			self._rate_limit_check()
-			
-			self.logger.debug(f"Fetching historical data for {symbol}, timeframe: {timeframe}, count: {count}")
+			candles = self._fetch_historical_candles(symbol, timeframe, count)
+			return self._candles_to_market_data(candles, symbol)
 			
-			# Map timeframe to Dhan API format
-			timeframe_map = {
-				'1min': '1min',
-				'5min': '5min',
-				'15min': '15min',
-				'30min': '30min',
-				'1hour': '1hour',
-				'1day': '1day'
-			}
-			
-			dhan_timeframe = timeframe_map.get(timeframe, '5min')
+		except Exception as e:
+			self.logger.error(f"Failed to get historical data for {symbol}: {str(e)}")
+			self._handle_api_error(e, f"get_historical_data for {symbol}")
+	
+	def get_historical_frame(self, symbol: str, timeframe: str, count: int) -> MarketDataFrame:
+		"""
+		Get historical market data for a symbol as columnar arrays.
+		
+		Same data as get_historical_data, without building per-candle objects.
+		
+		Args:
+			symbol: Trading symbol
+			timeframe: Timeframe (e.g., '5min', '1day')
+			count: Number of candles to fetch
 			
-			# Historical data not available from DhanService for now
-			self.logger.debug(f"Historical data requested for {symbol} but not available")
-			return []
+		Returns:
+			MarketDataFrame with one array per field
+		"""
+		try:
+			candles = self._fetch_historical_candles(symbol, timeframe, count)
+			return self._candles_to_frame(candles, symbol)
 			
-			# Convert to MarketData objects
-			market_data_list = []
-			for candle in historical_data:
-				try:
-					market_data = MarketData(
-						symbol=symbol,
-						open=Decimal(str(candle.get('open', 0))),
-						high=Decimal(str(candle.get('high', 0))),
-						low=Decimal(str(candle.get('low', 0))),
-						close=Decimal(str(candle.get('close', 0))),
-						volume=int(candle.get('volume', 0)),
-						timestamp=datetime.fromisoformat(candle.get('timestamp', datetime.now().isoformat())),
-						ltp=Decimal(str(candle.get('close', 0)))  # Use close as LTP for historical data
-					)
-					market_data_list.append(market_data)
-				except Exception as e:
-					self.logger.warning(f"Failed to parse candle data for {symbol}: {str(e)}")
-					continue
+		except Exception as e:
+			self.logger.error(f"Failed to get historical frame for {symbol}: {str(e)}")
+			self._handle_api_error(e, f"get_historical_frame for {symbol}")
+	
+	def _fetch_historical_candles(self, symbol: str, timeframe: str, count: int) -> List[Dict]:
+		"""
+		Fetch raw historical candles from the API.
+		
+		Historical data is not available from DhanService for now, so no
+		request is made (and no rate-limit slot is used); callers get an
+		empty list and treat it as no data.
+		"""
+		if self.logger.is_enabled_for('DEBUG'):
+			self.logger.debug(f"Historical data requested for {symbol} ({timeframe}, {count}) but not available")
+		return []
+	
+	def _candles_to_frame(self, candles: List[Dict], symbol: str) -> MarketDataFrame:
+		"""
+		Parse raw API candles into a MarketDataFrame.
+		
+		Columns are converted in one vectorized pass with pandas/NumPy.
+		Candles whose timestamp cannot be parsed are dropped.
+		
+		Args:
+			candles: List of candle dictionaries from the API
+			symbol: Trading symbol the candles belong to
 			
-			self.logger.debug(f"Historical data fetched successfully for {symbol}: {len(market_data_list)} candles")
-			return market_data_list
+		Returns:
+			MarketDataFrame with one array per field
+		"""
+		if not candles:
+			return MarketDataFrame(symbol=symbol)
+		
+		df = pd.DataFrame(candles).reindex(columns=_CANDLE_COLUMNS)
+		ts = pd.to_datetime(df['timestamp'], errors='coerce')
+		valid = ts.notna()
+		if not valid.all():
+			self.logger.warning(f"Dropped {int((~valid).sum())} candles with invalid timestamps for {symbol}")
+			df, ts = df[valid], ts[valid]
+		prices = df[['open', 'high', 'low', 'close']].fillna(0).to_numpy(dtype=np.float64)
+		
+		return MarketDataFrame(
+			symbol=symbol,
+			ts=ts.to_numpy(),
+			open=prices[:, 0],
+			high=prices[:, 1],
+			low=prices[:, 2],
+			close=prices[:, 3],
+			volume=df['volume'].fillna(0).to_numpy(dtype=np.int64)
+		)
+	
+	def _candles_to_market_data(self, candles: List[Dict], symbol: str) -> List[MarketData]:
+		"""
+		Convert raw API candles to MarketData objects.
+		
+		Columns are parsed in one vectorized pass; only the final objects
+		are built per row, with prices from the cached tick factory.
+		"""
+		return self._candles_to_frame(candles, symbol).to_list(_to_price)
+	
+	def append_bar(self, bar: MarketData) -> None:
+		"""
+		Record a completed bar in the symbol's rolling OHLCV window.
+		
+		Args:
+			bar: MarketData holding the bar's OHLCV values
+		"""
+		buffer = self._bar_buffers.get(bar.symbol)
+		if buffer is None:
+			buffer = OHLCVRingBuffer(bar.symbol, self.config.broker.bar_buffer_size)
+			self._bar_buffers[bar.symbol] = buffer
+		
+		buffer.append(bar.timestamp, float(bar.open), float(bar.high), float(bar.low),
+					  float(bar.close), bar.volume)
+	
+	def get_bar_view(self, symbol: str) -> MarketDataFrame:
+		"""
+		Get the rolling OHLCV window for a symbol without copying.
+		
+		The returned arrays alias the buffer and change as bars are appended.
+		
+		Args:
+			symbol: Trading symbol
 			
-		except Exception as e:
-			self.logger.error(f"Failed to get historical data for {symbol}: {str(e)}")
-			self._handle_api_error(e, f"get_historical_data for {symbol}")
+		Returns:
+			MarketDataFrame over the buffered bars, oldest first
+		"""
+		buffer = self._bar_buffers.get(symbol)
+		if buffer is None:
+			return MarketDataFrame(symbol=symbol)
+		return buffer.view()
+	
+	# Async variants: the TSL client is blocking, so each call runs on the
+	# provider's worker pool and the event loop stays free to overlap them.
+	# Where possible the rate-limit slot is awaited on the loop first, so a
+	# throttled request does not hold a pool thread while it waits.
+	
+	async def _run_in_executor(self, func: Callable[..., Any], *args: Any) -> Any:
+		"""Run a blocking provider call on the worker pool."""
+		loop = asyncio.get_running_loop()
+		return await loop.run_in_executor(self._executor, func, *args)
+	
+	async def aget_ltp(self, symbol: str) -> Optional[Decimal]:
+		"""Async variant of get_ltp."""
+		return await self._run_in_executor(self.get_ltp, symbol)
+	
+	async def aget_ltp_bulk(self, symbols: List[str]) -> Dict[str, Decimal]:
+		"""
+		Async variant of get_ltp_bulk.
+		
+		Prices come from the batched market feed first; symbols it misses
+		are fetched individually and awaited together. Failed symbols are
+		skipped.
+		"""
+		if not symbols:
+			return {}
+		
+		# The fallback stays on this loop rather than inside get_ltp_bulk, so a
+		# pool worker never blocks on further work queued to the same pool
+		ltps = await self._run_in_executor(self._fetch_ltp_batch, symbols)
+		missing = [symbol for symbol in symbols if symbol not in ltps]
+		
+		async def fetch(symbol: str) -> Optional[float]:
+			await self._arate_limit_check()
+			return await self._run_in_executor(self._fetch_bulk_ltp, symbol, False)
+		
+		results = await asyncio.gather(*(fetch(symbol) for symbol in missing), return_exceptions=True)
+		
+		for symbol, ltp in zip(missing, results):
+			if isinstance(ltp, Exception):
+				self.logger.warning(f"Failed to get LTP for {symbol}: {ltp}")
+			elif ltp is not None:
+				ltps[symbol] = ltp
+		return {symbol: _to_price(ltp) for symbol, ltp in ltps.items()}
+	
+	async def aget_ohlcv(self, symbol: str, interval: str = "1D", limit: int = 100) -> List:
+		"""Async variant of get_ohlcv."""
+		await self._arate_limit_check()
+		return await self._run_in_executor(self._fetch_ohlcv, symbol, interval, limit, False)
+	
+	async def aget_market_data(self, symbol: str) -> Optional[MarketData]:
+		"""Async variant of get_market_data."""
+		return await self._run_in_executor(self.get_market_data, symbol)
+	
+	async def aget_historical_data(self, symbol: str, timeframe: str, count: int) -> List[MarketData]:
+		"""Async variant of get_historical_data."""
+		return await self._run_in_executor(self.get_historical_data, symbol, timeframe, count)
+	
+	async def aget_historical_frame(self, symbol: str, timeframe: str, count: int) -> MarketDataFrame:
+		"""Async variant of get_historical_frame."""
+		return await self._run_in_executor(self.get_historical_frame, symbol, timeframe, count)
+	
+	def _refresh_market_times(self) -> None:
+		"""Parse market-hour boundaries from config into minutes since midnight if they changed."""
+		market = self.config.market
+		key = (market.market_open_time, market.market_close_time,
+			   market.pre_market_start, market.post_market_end)
+		if key == self._market_times_key:
+			return
+		
+		self._open_m, self._close_m, self._pre_m, self._post_m = (_to_minutes(value) for value in key)
+		
+		# Open/close and post-market end are inclusive
+		self._phase_boundaries = [self._pre_m, self._open_m, self._close_m + 1, self._post_m + 1]
+		self._next_phase_minute = {
+			"PRE_MARKET": self._open_m,
+			"MARKET_OPEN": self._close_m,
+			"POST_MARKET": self._pre_m,
+			"MARKET_CLOSED": self._pre_m
+		}
+		self._market_times_key = key
 	
 	def is_market_open(self) -> bool:
 		"""
@@ -393,16 +1039,16 @@ class DhanMarketDataProvider(IMarketDataProvider):
 		"""
 		try:
 			current_time = datetime.now()
-			current_time_str = current_time.strftime("%H:%M")
+			current_minute = current_time.hour * 60 + current_time.minute
 			
 			# Get market hours from config
-			market_open = self.config.market.market_open_time
-			market_close = self.config.market.market_close_time
+			self._refresh_market_times()
 			
 			# Simple time-based check (can be enhanced with holiday calendar)
-			is_open = market_open <= current_time_str <= market_close
+			is_open = self._open_m <= current_minute <= self._close_m
 			
-			self.logger.debug(f"Market status check: {current_time_str}, Open: {is_open}")
+			if self.logger.is_enabled_for('DEBUG'):
+				self.logger.debug(f"Market status check: {current_time:%H:%M}, Open: {is_open}")
 			return is_open
 			
 		except Exception as e:
@@ -410,7 +1056,7 @@ class DhanMarketDataProvider(IMarketDataProvider):
 			# Default to closed if check fails
 			return False
 	
-	def get_market_status(self) -> Dict[str, any]:
+	def get_market_status(self) -> Dict[str, Any]:
 		"""
 		Get detailed market status information.
 		
@@ -419,25 +1065,24 @@ class DhanMarketDataProvider(IMarketDataProvider):
 		"""
 		try:
 			current_time = datetime.now()
-			current_time_str = current_time.strftime("%H:%M")
+			current_minute = current_time.hour * 60 + current_time.minute
+			current_time_str = f"{current_time.hour:02d}:{current_time.minute:02d}"
 			
-			market_open = self.config.market.market_open_time
-			market_close = self.config.market.market_close_time
-			pre_market_start = self.config.market.pre_market_start
-			post_market_end = self.config.market.post_market_end
+			self._refresh_market_times()
+			market_open, market_close, pre_market_start, post_market_end = self._market_times_key
 			
 			# Determine market phase
-			if pre_market_start <= current_time_str < market_open:
-				phase = "PRE_MARKET"
-			elif market_open <= current_time_str <= market_close:
-				phase = "MARKET_OPEN"
-			elif market_close < current_time_str <= post_market_end:
-				phase = "POST_MARKET"
-			else:
-				phase = "MARKET_CLOSED"
+			phase = _PHASE_NAMES[bisect.bisect_right(self._phase_boundaries, current_minute)]
+			
+			# Prices and symbol metadata cached during the session are stale once the market closes
+			if phase != self._last_market_phase:
+				if phase == "MARKET_CLOSED":
+					self._clear_ltp_cache()
+					self._clear_symbol_caches()
+				self._last_market_phase = phase
 			
 			# Calculate time to next phase
-			time_to_next = self._calculate_time_to_next_phase(current_time_str, phase)
+			time_to_next = self._calculate_time_to_next_phase(current_minute, phase)
 			
 			status = {
 				'current_time': current_time_str,
@@ -450,48 +1095,33 @@ class DhanMarketDataProvider(IMarketDataProvider):
 				'post_market_end': post_market_end
 			}
 			
-			self.logger.debug(f"Market status: {status}")
+			if self.logger.is_enabled_for('DEBUG'):
+				self.logger.debug(f"Market status: {status}")
 			return status
 			
 		except Exception as e:
 			self.logger.error(f"Failed to get market status: {str(e)}")
+			now = datetime.now()
 			return {
-				'current_time': datetime.now().strftime("%H:%M"),
+				'current_time': f"{now.hour:02d}:{now.minute:02d}",
 				'market_phase': "UNKNOWN",
 				'is_trading': False,
 				'error': str(e)
 			}
 	
-	def _calculate_time_to_next_phase(self, current_time: str, current_phase: str) -> str:
+	def _calculate_time_to_next_phase(self, current_minute: int, current_phase: str) -> str:
 		"""Calculate time to next market phase."""
 		try:
-			current = datetime.strptime(current_time, "%H:%M")
+			# Minutes until the next boundary, wrapping past midnight into the next day
+			time_diff = (self._next_phase_minute[current_phase] - current_minute) % 1440
 			
-			if current_phase == "PRE_MARKET":
-				next_time = datetime.strptime(self.config.market.market_open_time, "%H:%M")
-			elif current_phase == "MARKET_OPEN":
-				next_time = datetime.strptime(self.config.market.market_close_time, "%H:%M")
-			elif current_phase == "POST_MARKET":
-				next_time = datetime.strptime(self.config.market.pre_market_start, "%H:%M")
-				next_time += timedelta(days=1)  # Next day
-			else:  # MARKET_CLOSED
-				next_time = datetime.strptime(self.config.market.pre_market_start, "%H:%M")
-				next_time += timedelta(days=1)  # Next day
-			
-			time_diff = next_time - current
-			if time_diff.total_seconds() < 0:
-				time_diff += timedelta(days=1)
-			
-			hours = int(time_diff.total_seconds() // 3600)
-			minutes = int((time_diff.total_seconds() % 3600) // 60)
-			
-			return f"{hours:02d}:{minutes:02d}"
+			return f"{time_diff // 60:02d}:{time_diff % 60:02d}"
 			
 		except Exception as e:
 			self.logger.warning(f"Failed to calculate time to next phase: {str(e)}")
 			return "00:00"
 	
-	def get_symbol_info(self, symbol: str) -> Optional[Dict[str, any]]:
+	def get_symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
 		"""
 		Get basic information about a trading symbol.
 		
@@ -499,24 +1129,28 @@ class DhanMarketDataProvider(IMarketDataProvider):
 			symbol: Trading symbol
 			
 		Returns:
-			Dictionary containing symbol information or None if failed
+			Dictionary containing symbol information or None if failed.
+			Each call returns a new dictionary, so callers may modify it.
 		"""
 		try:
-			self._rate_limit_check()
-			
-			# This would typically call a different API endpoint
-			# For now, return basic info
-			info = {
-				'symbol': symbol,
-				'exchange': 'NSE',  # Default to NSE
-				'instrument_type': 'EQ',  # Default to Equity
-				'lot_size': 1,
-				'tick_size': 0.05,
-				'last_updated': datetime.now().isoformat()
-			}
-			
-			self.logger.debug(f"Symbol info for {symbol}: {info}")
-			return info
+			self._sync_symbol_caches()
+			info = self._symbol_info_cache.get(symbol)
+			if info is None:
+				# This would typically call a different API endpoint
+				# For now, cache basic info
+				info = {
+					'symbol': symbol,
+					'exchange': 'NSE',  # Default to NSE
+					'instrument_type': 'EQ',  # Default to Equity
+					'lot_size': 1,
+					'tick_size': 0.05
+				}
+				self._symbol_info_cache[symbol] = info
+				
+				if self.logger.is_enabled_for('DEBUG'):
+					self.logger.debug(f"Symbol info for {symbol}: {info}")
+			
+			return {**info, 'last_updated': datetime.now().isoformat()}
 			
 		except Exception as e:
 			self.logger.error(f"Failed to get symbol info for {symbol}: {str(e)}")
@@ -533,18 +1167,68 @@ class DhanMarketDataProvider(IMarketDataProvider):
 			True if symbol is valid, False otherwise
 		"""
 		try:
+			self._sync_symbol_caches()
+			if symbol in self._valid_symbols:
+				return True
+			
+			# Recently failed symbols are rejected without hitting the API again
+			failed_at = self._invalid_symbols.get(symbol)
+			if failed_at is not None and time.monotonic() - failed_at < self.config.broker.invalid_symbol_ttl:
+				return False
+			
 			# Try to get LTP - if it fails, symbol might be invalid
 			ltp = self.get_ltp(symbol)
-			return ltp is not None and ltp > 0
+			is_valid = ltp is not None and ltp > 0
+			
+			if is_valid:
+				self._valid_symbols.add(symbol)
+				self._invalid_symbols.pop(symbol, None)
+			else:
+				self._invalid_symbols[symbol] = time.monotonic()
+			return is_valid
 			
 		except Exception as e:
-			self.logger.debug(f"Symbol validation failed for {symbol}: {str(e)}")
+			if self.logger.is_enabled_for('DEBUG'):
+				self.logger.debug(f"Symbol validation failed for {symbol}: {str(e)}")
 			return False 
 	
 	def _fetch_scrip_master(self) -> Dict[str, str]:
 		"""
 		Fetch Dhan's scrip master to map trading symbols to security IDs.
+		
+		Concurrent callers during a refresh share a single download. After
+		a failed download the previous (possibly empty) mapping is served
+		for _SCRIP_MASTER_RETRY_SECONDS rather than retrying on every call.
 		"""
+		if (self._scrip_master_cache and
+			time.time() - self._scrip_master_cache_time < self._cache_validity_hours * 3600):
+			return self._scrip_master_cache
+		if time.monotonic() - self._scrip_master_failed_at < _SCRIP_MASTER_RETRY_SECONDS:
+			return self._scrip_master_cache
+		
+		with self._scrip_master_lock:
+			future = self._scrip_master_inflight
+			is_owner = future is None
+			if is_owner:
+				future = Future()
+				self._scrip_master_inflight = future
+		
+		if not is_owner:
+			return future.result()
+		
+		try:
+			scrip_master = self._download_scrip_master()
+			future.set_result(scrip_master)
+			return scrip_master
+		except Exception as e:
+			future.set_exception(e)
+			raise
+		finally:
+			with self._scrip_master_lock:
+				self._scrip_master_inflight = None
+	
+	def _download_scrip_master(self) -> Dict[str, str]:
+		"""Download and parse the scrip master unless the cache is still valid."""
 		try:
 			# Check if cache is still valid
 			current_time = time.time()
@@ -552,61 +1236,121 @@ class DhanMarketDataProvider(IMarketDataProvider):
 				current_time - self._scrip_master_cache_time < self._cache_validity_hours * 3600):
 				return self._scrip_master_cache
 			
-			# Fetch fresh scrip master
+			# Fetch fresh scrip master, conditional on the copy persisted by a previous run
 			url = "https://images.dhan.co/api-data/api-scrip-master.csv"
-			response = requests.get(url, timeout=30)
-			response.raise_for_status()
-			
-			# Parse CSV and build mapping
-			lines = response.text.strip().split('\n')
-			symbol_to_security_id = {}
-			
-			self.logger.info(f"Parsing {len(lines)} lines from scrip master")
-			
-			# Look for NSE equity symbols throughout the entire CSV
-			nse_count = 0
-			major_stocks = ["RELIANCE", "TCS", "HDFC", "INFY", "ICICIBANK", "HINDUNILVR", "ITC", "SBIN", 
-						   "BHARTIARTL", "AXISBANK", "ASIANPAINT", "MARUTI", "HCLTECH", "ULTRACEMCO"]
-			
-			# First pass: look for major stocks specifically
-			for i, line in enumerate(lines[1:]):  # Skip header
-				parts = line.split(',')
-				if len(parts) >= 6:
-					exchange = parts[0].strip()
-					segment = parts[1].strip()
-					security_id = parts[2].strip()
-					instrument_name = parts[3].strip()
-					trading_symbol = parts[5].strip()
+			disk_cache = self._load_scrip_master_disk_cache()
+			headers = {"Accept-Encoding": "gzip, deflate"}  # The CSV compresses ~5x on the wire
+			if disk_cache:
+				if disk_cache.get("etag"):
+					headers["If-None-Match"] = disk_cache["etag"]
+				if disk_cache.get("last_modified"):
+					headers["If-Modified-Since"] = disk_cache["last_modified"]
+			
+			# Stream the body straight into the CSV parser instead of buffering the whole file
+			with self._http.get(url, timeout=30, headers=headers, stream=True) as response:
+				if response.status_code == 304 and disk_cache:
+					self.logger.info(f"Scrip master unchanged, using {len(disk_cache['data'])} symbols from disk cache")
+					self._scrip_master_cache = disk_cache["data"]
+					self._scrip_master_cache_time = current_time
+					self._secid.clear()
+					return self._scrip_master_cache
+				
+				response.raise_for_status()
+				response.raw.decode_content = True  # Let urllib3 undo any gzip transfer encoding
+				
+				if self.logger.is_enabled_for('DEBUG'):
+					self.logger.debug(f"Scrip master Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+				
+				# Parse in bounded chunks: exchange, security id, instrument, trading symbol
+				symbol_to_security_id = {}
+				row_count = 0
+				for chunk in pd.read_csv(response.raw, usecols=[0, 2, 3, 5], dtype=str, chunksize=50_000):
+					chunk.columns = ["exchange", "security_id", "instrument", "trading_symbol"]
+					row_count += len(chunk)
 					
 					# Only include NSE equity symbols
-					if exchange == "NSE" and instrument_name == "EQUITY":
-						symbol_to_security_id[trading_symbol] = security_id
-						nse_count += 1
-						
-						# Log major stock mappings
-						if trading_symbol in major_stocks:
-							self.logger.info(f"Found major stock: {trading_symbol} -> {security_id}")
-						
-						# Log first few NSE entries for debugging
-						if nse_count <= 10:
-							self.logger.info(f"Added NSE mapping: {trading_symbol} -> {security_id}")
+					nse_equity = chunk[(chunk["exchange"].str.strip() == "NSE") & (chunk["instrument"].str.strip() == "EQUITY")]
+					nse_equity = nse_equity.dropna(subset=["trading_symbol", "security_id"])
+					symbol_to_security_id.update(zip(nse_equity["trading_symbol"].str.strip(),
+													 nse_equity["security_id"].str.strip()))
+			
+			self.logger.info(f"Parsed {row_count} rows from scrip master")
 			
 			self.logger.info(f"Scrip master updated with {len(symbol_to_security_id)} NSE equity symbols")
-			self.logger.info(f"Major stocks found: {[s for s in major_stocks if s in symbol_to_security_id]}")
+			self.logger.info(f"Major stocks found: {[s for s in _MAJOR_STOCKS if s in symbol_to_security_id]}")
 			
 			# Update cache
 			self._scrip_master_cache = symbol_to_security_id
 			self._scrip_master_cache_time = current_time
+			self._secid.clear()
+			self._save_scrip_master_disk_cache(response, symbol_to_security_id)
 			return symbol_to_security_id
 			
 		except Exception as e:
 			self.logger.log_error(e, {"operation": "fetch_scrip_master"})
-			# Return empty dict if fetch fails
-			return {}
+			# Keep serving the previous mapping (empty if none) until the retry delay passes
+			self._scrip_master_failed_at = time.monotonic()
+			return self._scrip_master_cache
+	
+	def _load_scrip_master_disk_cache(self) -> Optional[Dict]:
+		"""
+		Load the persisted scrip master and its HTTP validators, if any.
+		
+		The file is plain JSON and is checked to be a symbol -> security ID
+		map of strings before use, so a tampered file can at worst be ignored.
+		"""
+		cache_file = self.config.broker.scrip_master_cache_file
+		if not cache_file or not os.path.exists(cache_file):
+			return None
+		
+		try:
+			with open(cache_file, 'r', encoding='utf-8') as f:
+				disk_cache = json.load(f)
+			mapping = disk_cache.get("data") if isinstance(disk_cache, dict) else None
+			if not isinstance(mapping, dict) or not all(
+				isinstance(symbol, str) and isinstance(security_id, str) for symbol, security_id in mapping.items()
+			):
+				self.logger.warning("Ignoring malformed scrip master disk cache")
+				return None
+			return disk_cache
+		except Exception as e:
+			self.logger.warning(f"Failed to load scrip master disk cache: {str(e)}")
+			return None
+	
+	def _save_scrip_master_disk_cache(self, response: requests.Response, mapping: Dict[str, str]) -> None:
+		"""Persist the scrip master with the ETag/Last-Modified it was served with."""
+		cache_file = self.config.broker.scrip_master_cache_file
+		if not cache_file:
+			return
+		
+		try:
+			cache_dir = os.path.dirname(cache_file)
+			if cache_dir:
+				os.makedirs(cache_dir, exist_ok=True)
+			
+			# Write to a temp file and swap it in so readers never see a partial file
+			tmp_file = f"{cache_file}.tmp"
+			with open(tmp_file, 'w', encoding='utf-8') as f:
+				json.dump({
+					"etag": response.headers.get("ETag"),
+					"last_modified": response.headers.get("Last-Modified"),
+					"data": mapping
+				}, f, separators=(',', ':'))
+			os.replace(tmp_file, cache_file)
+		except Exception as e:
+			self.logger.warning(f"Failed to save scrip master disk cache: {str(e)}")
 	
 	def _get_security_id(self, symbol: str) -> Optional[str]:
 		"""
 		Get security ID for a trading symbol.
+		
+		Resolved IDs are memoized so the scrip master TTL check only runs on a miss.
 		"""
-		scrip_master = self._fetch_scrip_master()
-		return scrip_master.get(symbol) 
\ No newline at end of file
+		security_id = self._secid.get(symbol)
+		if security_id:
+			return security_id
+		
+		security_id = self._fetch_scrip_master().get(symbol)
+		if security_id:
+			self._secid[symbol] = security_id
+		return security_id 
\ No newline at end of file
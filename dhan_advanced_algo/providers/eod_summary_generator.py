@@ -3,20 +3,70 @@ EOD (End of Day) Summary Generator
 Generates comprehensive daily reports of market scanning results and performance metrics.
 """
 
+import asyncio
 import json
-import pandas as pd
-from typing import Dict, List, Optional, Any
+import threading
+import time
+import numpy as np
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 from ..core.logging_service import LoggingService
 from ..core.config import ConfigurationManager
 from .market_scanner import MarketScanResult, TradingOpportunity
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+# Signal type -> code stored in the _sig_codes column; unknown types count as OTHER
+_SIG_BUY, _SIG_SELL, _SIG_SHORT, _SIG_OTHER = 0, 1, 2, 3
+_SIGNAL_CODES = {"BUY": _SIG_BUY, "SELL": _SIG_SELL, "SHORT": _SIG_SHORT}
+
+# Simplified symbol -> sector mapping
+_SECTOR_MAP = {
+    "RELIANCE": "OIL_GAS",
+    "TCS": "IT",
+    "HDFC": "BANKING",
+    "INFY": "IT",
+    "ICICIBANK": "BANKING",
+    "NIFTY": "INDEX",
+    "BANKNIFTY": "INDEX"
+}
+
+# Per-opportunity columns, kept row-aligned with opportunity_history
+_COLUMNS = ("_sig_codes", "_conf", "_rr", "_sym_idx", "_strat_idx", "_sector_idx", "_date_key", "_ts")
+
+
+def _intern_id(ids: Dict[str, int], names: List[str], value: str) -> int:
+    """Return the integer id for a name, assigning the next one on first sight."""
+    idx = ids.get(value)
+    if idx is None:
+        idx = ids[value] = len(names)
+        names.append(value)
+    return idx
+
+
+@lru_cache(maxsize=256)
+def _parse_ymd(date: str) -> int:
+    """Date ordinal of a "YYYY-MM-DD" report date; each distinct string is parsed once."""
+    return datetime.strptime(date, "%Y-%m-%d").toordinal()
+
+
+def _first_seen(ids: np.ndarray) -> List[int]:
+    """Distinct ids in order of first appearance."""
+    unique, first = np.unique(ids, return_index=True)
+    return unique[np.argsort(first)].tolist()
+
+
+@dataclass(slots=True, frozen=True)
 class DailyOpportunitySummary:
     """Summary of opportunities found in a day."""
     date: str
@@ -32,7 +82,17 @@ class DailyOpportunitySummary:
     strategy_performance: Dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class _DailyAggregates:
+    """Signal counts and sums for one day's rows, shared by the report sections."""
+    count: int
+    signal_counts: np.ndarray  # indexed by signal code
+    confidence_sum: float
+    risk_reward_sum: float
+    max_risk_reward_row: int  # column-store row of the highest risk/reward
+
+
+@dataclass(slots=True, frozen=True)
 class EODReport:
     """Complete EOD report."""
     report_date: str
@@ -46,6 +106,27 @@ class EODReport:
     generated_at: str
 
 
+def _empty_summary(date: str) -> DailyOpportunitySummary:
+    """Summary for a day without data.
+
+    Frozen dataclasses still hold mutable lists and dicts, so every call
+    builds new containers rather than sharing a template's.
+    """
+    return DailyOpportunitySummary(
+        date=date,
+        total_stocks_scanned=0,
+        opportunities_found=0,
+        buy_signals=0,
+        sell_signals=0,
+        short_signals=0,
+        avg_confidence_score=0.0,
+        avg_risk_reward_ratio=0.0,
+        top_opportunities=[],
+        sector_breakdown={},
+        strategy_performance={}
+    )
+
+
 class EODSummaryGenerator:
     """
     EOD Summary Generator
@@ -57,13 +138,43 @@ class EODSummaryGenerator:
         self.config = config
         self.logger = LoggingService()
         
-        # Report storage
-        self.daily_reports: List[EODReport] = []
+        # Report storage, oldest first; retention only ever trims the head
+        self.daily_reports: Deque[EODReport] = deque()
         self.opportunity_history: List[TradingOpportunity] = []
         
+        # Column store of opportunity_history for vectorized aggregation
+        self._n_rows = 0
+        self._sig_codes = np.empty(0, dtype=np.int8)
+        self._conf = np.empty(0, dtype=np.float64)
+        self._rr = np.empty(0, dtype=np.float64)
+        self._sym_idx = np.empty(0, dtype=np.int32)
+        self._strat_idx = np.empty(0, dtype=np.int32)
+        self._sector_idx = np.empty(0, dtype=np.int32)
+        self._date_key = np.empty(0, dtype=np.int32)  # date ordinal
+        self._ts = np.empty(0, dtype=np.float64)  # epoch seconds, for retention
+        self._by_date: Dict[int, List[int]] = defaultdict(list)  # date ordinal -> row sequence numbers
+        self._row_base = 0  # Rows trimmed so far; row position = sequence number - _row_base
+        self._symbol_ids: Dict[str, int] = {}
+        self._symbol_names: List[str] = []
+        self._strat_ids: Dict[str, int] = {}
+        self._strat_names: List[str] = []
+        self._sector_ids: Dict[str, int] = {}
+        self._sector_names: List[str] = []
+        self._sector_cache: Dict[str, int] = {}  # symbol -> sector id
+        
         # Configuration
         self.report_retention_days = getattr(config.eod_summary, 'report_retention_days', 30)
         self.min_confidence_threshold = getattr(config.eod_summary, 'min_confidence_threshold', 0.7)
+        self.cleanup_interval_seconds = getattr(config.eod_summary, 'cleanup_interval_seconds', 3600.0)
+        self._last_cleanup = 0.0  # monotonic time of the last retention sweep
+        
+        # Retention sweeps and file exports run off the caller's thread
+        self._background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eod-summary")
+        self._data_lock = threading.Lock()  # Guards history, column store and reports
+        
+        # get_report_summary results, keyed by (date, reports version)
+        self._reports_version = 0  # Bumped whenever daily_reports changes
+        self._summary_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
         
         self.logger.info("EOD Summary Generator initialized")
     
@@ -71,105 +182,148 @@ class EODSummaryGenerator:
         """Add a scan result to the daily tracking."""
         try:
             # Store opportunities in history
-            self.opportunity_history.extend(scan_result.opportunities)
+            with self._data_lock:
+                self.opportunity_history.extend(scan_result.opportunities)
+                self._append_rows(scan_result.opportunities)
             
-            # Clean old data
-            self._cleanup_old_data()
+            # Clean old data; retention is in days, so an occasional background sweep is enough
+            now = time.monotonic()
+            if now - self._last_cleanup >= self.cleanup_interval_seconds:
+                self._last_cleanup = now
+                self._background.submit(self._cleanup_old_data)
             
             self.logger.debug(f"Added scan result with {len(scan_result.opportunities)} opportunities")
             
         except Exception as e:
             self.logger.log_error(e, {"operation": "add_scan_result"})
     
+    def _append_rows(self, opportunities: List[TradingOpportunity]) -> None:
+        """Append opportunities to the column store, growing it geometrically."""
+        count = len(opportunities)
+        if not count:
+            return
+        
+        start = self._n_rows
+        end = start + count
+        if end > len(self._conf):
+            capacity = max(end, 2 * len(self._conf), 1024)
+            for name in _COLUMNS:
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:start] = column[:start]
+                setattr(self, name, grown)
+        
+        self._sig_codes[start:end] = [_SIGNAL_CODES.get(opp.signal_type, _SIG_OTHER) for opp in opportunities]
+        self._conf[start:end] = [opp.confidence_score for opp in opportunities]
+        self._rr[start:end] = [opp.risk_reward_ratio for opp in opportunities]
+        self._sym_idx[start:end] = [
+            _intern_id(self._symbol_ids, self._symbol_names, opp.symbol) for opp in opportunities
+        ]
+        self._strat_idx[start:end] = [
+            _intern_id(self._strat_ids, self._strat_names, opp.strategy_name) for opp in opportunities
+        ]
+        self._sector_idx[start:end] = [self._get_sector_id(opp.symbol) for opp in opportunities]
+        ordinals = [opp.timestamp.toordinal() for opp in opportunities]
+        self._date_key[start:end] = ordinals
+        for seq, ordinal in enumerate(ordinals, start + self._row_base):
+            self._by_date[ordinal].append(seq)
+        self._ts[start:end] = [opp.timestamp.timestamp() for opp in opportunities]
+        self._n_rows = end
+    
     def generate_daily_report(self, date: str = None) -> EODReport:
         """Generate comprehensive EOD report for a specific date."""
         try:
             if date is None:
                 date = datetime.now().strftime("%Y-%m-%d")
             
-            # Get opportunities for the specified date
-            daily_opportunities = self._get_daily_opportunities(date)
-            
-            if not daily_opportunities:
-                self.logger.warning(f"No opportunities found for date: {date}")
-                return self._generate_empty_report(date)
-            
-            # Generate summary components
-            opportunity_summary = self._generate_opportunity_summary(daily_opportunities, date)
-            missed_opportunities = self._identify_missed_opportunities(daily_opportunities)
-            strategy_analysis = self._analyze_strategy_performance(daily_opportunities)
-            market_analysis = self._analyze_market_conditions(daily_opportunities)
-            recommendations = self._generate_recommendations(daily_opportunities, strategy_analysis)
-            risk_metrics = self._calculate_risk_metrics(daily_opportunities)
-            
-            # Create EOD report
-            eod_report = EODReport(
-                report_date=date,
-                market_sentiment=self._determine_market_sentiment(daily_opportunities),
-                scan_summary=opportunity_summary,
-                missed_opportunities=missed_opportunities,
-                strategy_analysis=strategy_analysis,
-                market_analysis=market_analysis,
-                recommendations=recommendations,
-                risk_metrics=risk_metrics,
-                generated_at=datetime.now().isoformat()
-            )
-            
-            # Store report
-            self.daily_reports.append(eod_report)
-            
-            self.logger.info(f"Generated EOD report for {date} with {len(daily_opportunities)} opportunities")
-            return eod_report
-            
+            with self._data_lock:
+                # Get opportunities for the specified date
+                rows = self._get_daily_rows(date)
+                daily_opportunities = [self.opportunity_history[i] for i in rows.tolist()]
+                
+                if not daily_opportunities:
+                    self.logger.warning(f"No opportunities found for date: {date}")
+                    return self._generate_empty_report(date)
+                
+                # Generate summary components
+                aggregates = self._daily_aggregates(rows)
+                opportunity_summary = self._generate_opportunity_summary(rows, aggregates, date)
+                missed_opportunities = self._identify_missed_opportunities(rows)
+                strategy_analysis = self._analyze_strategy_performance(rows)
+                market_analysis = self._analyze_market_conditions(aggregates)
+                recommendations = self._generate_recommendations(daily_opportunities, strategy_analysis, market_analysis)
+                risk_metrics = self._calculate_risk_metrics(aggregates, strategy_analysis)
+                
+                # Create EOD report
+                eod_report = EODReport(
+                    report_date=date,
+                    market_sentiment=self._determine_market_sentiment(aggregates),
+                    scan_summary=opportunity_summary,
+                    missed_opportunities=missed_opportunities,
+                    strategy_analysis=strategy_analysis,
+                    market_analysis=market_analysis,
+                    recommendations=recommendations,
+                    risk_metrics=risk_metrics,
+                    generated_at=datetime.now().isoformat()
+                )
+                
+                # Store report
+                self.daily_reports.append(eod_report)
+                self._reports_version += 1
+                
+                self.logger.info(f"Generated EOD report for {date} with {len(daily_opportunities)} opportunities")
+                return eod_report
+                
         except Exception as e:
             self.logger.log_error(e, {"operation": "generate_daily_report", "date": date})
             return self._generate_empty_report(date)
     
-    def _get_daily_opportunities(self, date: str) -> List[TradingOpportunity]:
-        """Get all opportunities for a specific date."""
+    def _get_daily_rows(self, date: str) -> np.ndarray:
+        """Get the column-store row indices of all opportunities for a specific date."""
         try:
-            target_date = datetime.strptime(date, "%Y-%m-%d").date()
-            
-            daily_opportunities = []
-            for opportunity in self.opportunity_history:
-                if opportunity.timestamp.date() == target_date:
-                    daily_opportunities.append(opportunity)
-            
-            return daily_opportunities
+            rows = np.array(self._by_date.get(_parse_ymd(date), ()), dtype=np.int64) - self._row_base
+            return rows[rows >= 0]  # The oldest bucket may have been partly trimmed
             
         except Exception as e:
             self.logger.log_error(e, {"operation": "get_daily_opportunities", "date": date})
-            return []
+            return np.empty(0, dtype=np.int64)
+    
+    def _get_daily_opportunities(self, date: str) -> List[TradingOpportunity]:
+        """Get all opportunities for a specific date."""
+        return [self.opportunity_history[i] for i in self._get_daily_rows(date).tolist()]
     
-    def _generate_opportunity_summary(self, opportunities: List[TradingOpportunity], date: str) -> DailyOpportunitySummary:
-        """Generate summary of daily opportunities."""
+    def _daily_aggregates(self, rows: np.ndarray) -> _DailyAggregates:
+        """Count signals and sum confidence and risk/reward over a day's rows in one sweep."""
+        risk_reward = self._rr[rows]
+        return _DailyAggregates(
+            count=len(rows),
+            signal_counts=np.bincount(self._sig_codes[rows], minlength=4),
+            confidence_sum=float(np.add.reduce(self._conf[rows])),
+            risk_reward_sum=float(np.add.reduce(risk_reward)),
+            max_risk_reward_row=int(rows[risk_reward.argmax()]) if len(rows) else -1
+        )
+    
+    def _generate_opportunity_summary(self, rows: np.ndarray, aggregates: _DailyAggregates,
+                                      date: str) -> DailyOpportunitySummary:
+        """Generate summary of daily opportunities from their column-store rows."""
         try:
-            if not opportunities:
-                return DailyOpportunitySummary(
-                    date=date,
-                    total_stocks_scanned=0,
-                    opportunities_found=0,
-                    buy_signals=0,
-                    sell_signals=0,
-                    short_signals=0,
-                    avg_confidence_score=0.0,
-                    avg_risk_reward_ratio=0.0,
-                    top_opportunities=[],
-                    sector_breakdown={},
-                    strategy_performance={}
-                )
+            if not aggregates.count:
+                return _empty_summary(date)
             
-            # Count signal types
-            buy_signals = sum(1 for opp in opportunities if opp.signal_type == "BUY")
-            sell_signals = sum(1 for opp in opportunities if opp.signal_type == "SELL")
-            short_signals = sum(1 for opp in opportunities if opp.signal_type == "SHORT")
+            signal_counts = aggregates.signal_counts
             
             # Calculate averages
-            avg_confidence = sum(opp.confidence_score for opp in opportunities) / len(opportunities)
-            avg_risk_reward = sum(opp.risk_reward_ratio for opp in opportunities) / len(opportunities)
-            
-            # Get top opportunities (highest confidence)
-            top_opportunities = sorted(opportunities, key=lambda x: x.confidence_score, reverse=True)[:10]
+            avg_confidence = aggregates.confidence_sum / aggregates.count
+            avg_risk_reward = aggregates.risk_reward_sum / aggregates.count
+            
+            # Get top opportunities (highest confidence) without sorting the whole day
+            # (ties keep scan order, as a stable sort would)
+            confidence = self._conf[rows]
+            top_n = min(10, len(rows))
+            cutoff = -np.partition(-confidence, top_n - 1)[top_n - 1]
+            top = np.flatnonzero(confidence >= cutoff)
+            top = top[np.lexsort((top, -confidence[top]))][:top_n]
+            top_opportunities = [self.opportunity_history[i] for i in rows[top].tolist()]
             top_opps_data = [
                 {
                     "symbol": opp.symbol,
@@ -183,24 +337,22 @@ class EODSummaryGenerator:
             ]
             
             # Sector breakdown (simplified - using symbol prefixes)
-            sector_breakdown = {}
-            for opp in opportunities:
-                sector = self._get_sector_from_symbol(opp.symbol)
-                sector_breakdown[sector] = sector_breakdown.get(sector, 0) + 1
+            sectors = self._sector_idx[rows]
+            sector_counts = np.bincount(sectors)
+            sector_breakdown = {self._sector_names[i]: int(sector_counts[i]) for i in _first_seen(sectors)}
             
             # Strategy performance
-            strategy_performance = {}
-            for opp in opportunities:
-                strategy = opp.strategy_name
-                strategy_performance[strategy] = strategy_performance.get(strategy, 0) + 1
+            strategies = self._strat_idx[rows]
+            strategy_counts = np.bincount(strategies)
+            strategy_performance = {self._strat_names[i]: int(strategy_counts[i]) for i in _first_seen(strategies)}
             
             return DailyOpportunitySummary(
                 date=date,
-                total_stocks_scanned=len(set(opp.symbol for opp in opportunities)),  # Approximate
-                opportunities_found=len(opportunities),
-                buy_signals=buy_signals,
-                sell_signals=sell_signals,
-                short_signals=short_signals,
+                total_stocks_scanned=len(np.unique(self._sym_idx[rows])),  # Approximate
+                opportunities_found=aggregates.count,
+                buy_signals=int(signal_counts[_SIG_BUY]),
+                sell_signals=int(signal_counts[_SIG_SELL]),
+                short_signals=int(signal_counts[_SIG_SHORT]),
                 avg_confidence_score=round(avg_confidence, 3),
                 avg_risk_reward_ratio=round(avg_risk_reward, 2),
                 top_opportunities=top_opps_data,
@@ -210,85 +362,61 @@ class EODSummaryGenerator:
             
         except Exception as e:
             self.logger.log_error(e, {"operation": "generate_opportunity_summary"})
-            return DailyOpportunitySummary(
-                date=date,
-                total_stocks_scanned=0,
-                opportunities_found=0,
-                buy_signals=0,
-                sell_signals=0,
-                short_signals=0,
-                avg_confidence_score=0.0,
-                avg_risk_reward_ratio=0.0,
-                top_opportunities=[],
-                sector_breakdown={},
-                strategy_performance={}
-            )
+            return _empty_summary(date)
     
-    def _identify_missed_opportunities(self, opportunities: List[TradingOpportunity]) -> List[Dict[str, Any]]:
-        """Identify potentially missed opportunities."""
+    def _identify_missed_opportunities(self, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """Identify potentially missed opportunities (signals filtered out by the confidence threshold)."""
         try:
-            missed_opportunities = []
-            
-            # Find opportunities with high confidence but not executed
-            high_confidence_opps = [
-                opp for opp in opportunities 
-                if opp.confidence_score >= 0.8 and opp.confidence_score < self.min_confidence_threshold
-            ]
+            # Mask on the confidence column; only the survivors become dicts
+            missed_rows = rows[self._conf[rows] < self.min_confidence_threshold]
             
-            for opp in high_confidence_opps:
-                missed_opp = {
+            return [
+                {
                     "symbol": opp.symbol,
                     "strategy": opp.strategy_name,
                     "signal": opp.signal_type,
                     "confidence": opp.confidence_score,
                     "reason": "Below confidence threshold",
-                    "potential_loss": "High confidence opportunity not captured"
+                    "potential_loss": "Opportunity not captured at the current threshold"
                 }
-                missed_opportunities.append(missed_opp)
-            
-            return missed_opportunities
+                for opp in (self.opportunity_history[i] for i in missed_rows.tolist())
+            ]
             
         except Exception as e:
             self.logger.log_error(e, {"operation": "identify_missed_opportunities"})
             return []
     
-    def _analyze_strategy_performance(self, opportunities: List[TradingOpportunity]) -> Dict[str, Any]:
-        """Analyze performance of different strategies."""
+    def _analyze_strategy_performance(self, rows: np.ndarray) -> Dict[str, Any]:
+        """Analyze performance of different strategies from their column-store rows."""
         try:
-            strategy_stats = {}
+            strategies = self._strat_idx[rows]
+            if not len(strategies):
+                return {}
+            
+            # Per-strategy counts and sums, one bincount each
+            n_strategies = int(strategies.max()) + 1
+            totals = np.bincount(strategies, minlength=n_strategies)
+            confidence_sums = np.bincount(strategies, weights=self._conf[rows], minlength=n_strategies)
+            risk_reward_sums = np.bincount(strategies, weights=self._rr[rows], minlength=n_strategies)
+            signal_counts = np.bincount(
+                strategies * 4 + self._sig_codes[rows], minlength=n_strategies * 4
+            ).reshape(n_strategies, 4)
             
-            for opp in opportunities:
-                strategy = opp.strategy_name
-                
-                if strategy not in strategy_stats:
-                    strategy_stats[strategy] = {
-                        "total_signals": 0,
-                        "buy_signals": 0,
-                        "sell_signals": 0,
-                        "short_signals": 0,
-                        "avg_confidence": 0.0,
-                        "avg_risk_reward": 0.0,
-                        "total_confidence": 0.0,
-                        "total_risk_reward": 0.0
-                    }
-                
-                stats = strategy_stats[strategy]
-                stats["total_signals"] += 1
-                stats["total_confidence"] += opp.confidence_score
-                stats["total_risk_reward"] += opp.risk_reward_ratio
-                
-                if opp.signal_type == "BUY":
-                    stats["buy_signals"] += 1
-                elif opp.signal_type == "SELL":
-                    stats["sell_signals"] += 1
-                elif opp.signal_type == "SHORT":
-                    stats["short_signals"] += 1
-            
-            # Calculate averages
-            for strategy, stats in strategy_stats.items():
-                if stats["total_signals"] > 0:
-                    stats["avg_confidence"] = round(stats["total_confidence"] / stats["total_signals"], 3)
-                    stats["avg_risk_reward"] = round(stats["total_risk_reward"] / stats["total_signals"], 2)
+            strategy_stats = {}
+            for i in _first_seen(strategies):
+                total = int(totals[i])
+                total_confidence = float(confidence_sums[i])
+                total_risk_reward = float(risk_reward_sums[i])
+                strategy_stats[self._strat_names[i]] = {
+                    "total_signals": total,
+                    "buy_signals": int(signal_counts[i, _SIG_BUY]),
+                    "sell_signals": int(signal_counts[i, _SIG_SELL]),
+                    "short_signals": int(signal_counts[i, _SIG_SHORT]),
+                    "avg_confidence": round(total_confidence / total, 3),
+                    "avg_risk_reward": round(total_risk_reward / total, 2),
+                    "total_confidence": total_confidence,
+                    "total_risk_reward": total_risk_reward
+                }
             
             return strategy_stats
             
@@ -296,50 +424,46 @@ class EODSummaryGenerator:
             self.logger.log_error(e, {"operation": "analyze_strategy_performance"})
             return {}
     
-    def _analyze_market_conditions(self, opportunities: List[TradingOpportunity]) -> Dict[str, Any]:
+    def _analyze_market_conditions(self, aggregates: _DailyAggregates) -> Dict[str, Any]:
         """Analyze overall market conditions."""
-        try:
-            if not opportunities:
-                return {"market_condition": "NO_DATA", "volatility": "UNKNOWN"}
-            
-            # Analyze signal distribution
-            total_signals = len(opportunities)
-            buy_ratio = sum(1 for opp in opportunities if opp.signal_type == "BUY") / total_signals
-            sell_ratio = sum(1 for opp in opportunities if opp.signal_type in ["SELL", "SHORT"]) / total_signals
-            
-            # Determine market condition
-            if buy_ratio > 0.6:
-                market_condition = "BULLISH"
-            elif sell_ratio > 0.6:
-                market_condition = "BEARISH"
-            else:
-                market_condition = "NEUTRAL"
-            
-            # Analyze confidence distribution
-            confidence_scores = [opp.confidence_score for opp in opportunities]
-            avg_confidence = sum(confidence_scores) / len(confidence_scores)
-            
-            if avg_confidence > 0.8:
-                volatility = "LOW"
-            elif avg_confidence > 0.6:
-                volatility = "MEDIUM"
-            else:
-                volatility = "HIGH"
-            
-            return {
-                "market_condition": market_condition,
-                "volatility": volatility,
-                "buy_ratio": round(buy_ratio, 3),
-                "sell_ratio": round(sell_ratio, 3),
-                "avg_confidence": round(avg_confidence, 3),
-                "total_signals": total_signals
-            }
-            
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "analyze_market_conditions"})
-            return {"market_condition": "ERROR", "volatility": "UNKNOWN"}
+        if not aggregates.count:
+            return {"market_condition": "NO_DATA", "volatility": "UNKNOWN"}
+        
+        # Analyze signal distribution
+        total_signals = aggregates.count
+        signal_counts = aggregates.signal_counts
+        buy_ratio = int(signal_counts[_SIG_BUY]) / total_signals
+        sell_ratio = int(signal_counts[_SIG_SELL] + signal_counts[_SIG_SHORT]) / total_signals
+        
+        # Determine market condition
+        if buy_ratio > 0.6:
+            market_condition = "BULLISH"
+        elif sell_ratio > 0.6:
+            market_condition = "BEARISH"
+        else:
+            market_condition = "NEUTRAL"
+        
+        # Analyze confidence distribution
+        avg_confidence = aggregates.confidence_sum / total_signals
+        
+        if avg_confidence > 0.8:
+            volatility = "LOW"
+        elif avg_confidence > 0.6:
+            volatility = "MEDIUM"
+        else:
+            volatility = "HIGH"
+        
+        return {
+            "market_condition": market_condition,
+            "volatility": volatility,
+            "buy_ratio": round(buy_ratio, 3),
+            "sell_ratio": round(sell_ratio, 3),
+            "avg_confidence": round(avg_confidence, 3),
+            "total_signals": total_signals
+        }
     
-    def _generate_recommendations(self, opportunities: List[TradingOpportunity], strategy_analysis: Dict[str, Any]) -> List[str]:
+    def _generate_recommendations(self, opportunities: List[TradingOpportunity], strategy_analysis: Dict[str, Any],
+                                  market_analysis: Dict[str, Any]) -> List[str]:
         """Generate trading recommendations based on analysis."""
         try:
             recommendations = []
@@ -357,7 +481,6 @@ class EODSummaryGenerator:
                         recommendations.append(f"Strategy '{strategy}' showing low confidence. Consider reducing exposure or reviewing parameters.")
             
             # Market condition recommendations
-            market_analysis = self._analyze_market_conditions(opportunities)
             if market_analysis["market_condition"] == "BULLISH":
                 recommendations.append("Market showing bullish bias. Focus on long opportunities and momentum strategies.")
             elif market_analysis["market_condition"] == "BEARISH":
@@ -377,10 +500,11 @@ class EODSummaryGenerator:
             self.logger.log_error(e, {"operation": "generate_recommendations"})
             return ["Error generating recommendations. Please check system logs."]
     
-    def _calculate_risk_metrics(self, opportunities: List[TradingOpportunity]) -> Dict[str, Any]:
+    def _calculate_risk_metrics(self, aggregates: _DailyAggregates,
+                                strategy_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate risk metrics for the day."""
         try:
-            if not opportunities:
+            if not aggregates.count:
                 return {
                     "total_risk": 0.0,
                     "avg_risk_per_opportunity": 0.0,
@@ -389,11 +513,11 @@ class EODSummaryGenerator:
                 }
             
             # Calculate risk metrics
-            total_risk = sum(opp.risk_reward_ratio for opp in opportunities)
-            avg_risk = total_risk / len(opportunities)
+            total_risk = aggregates.risk_reward_sum
+            avg_risk = total_risk / aggregates.count
             
             # Find highest risk opportunity
-            max_risk_opp = max(opportunities, key=lambda x: x.risk_reward_ratio)
+            max_risk_opp = self.opportunity_history[aggregates.max_risk_reward_row]
             max_risk_info = {
                 "symbol": max_risk_opp.symbol,
                 "strategy": max_risk_opp.strategy_name,
@@ -401,17 +525,10 @@ class EODSummaryGenerator:
                 "confidence": max_risk_opp.confidence_score
             }
             
-            # Risk distribution by strategy
-            risk_distribution = {}
-            for opp in opportunities:
-                strategy = opp.strategy_name
-                if strategy not in risk_distribution:
-                    risk_distribution[strategy] = []
-                risk_distribution[strategy].append(opp.risk_reward_ratio)
-            
-            # Calculate average risk per strategy
-            for strategy, risks in risk_distribution.items():
-                risk_distribution[strategy] = round(sum(risks) / len(risks), 2)
+            # Average risk per strategy, already reduced by _analyze_strategy_performance
+            risk_distribution = {
+                strategy: stats["avg_risk_reward"] for strategy, stats in strategy_analysis.items()
+            }
             
             return {
                 "total_risk": round(total_risk, 2),
@@ -424,66 +541,38 @@ class EODSummaryGenerator:
             self.logger.log_error(e, {"operation": "calculate_risk_metrics"})
             return {"total_risk": 0.0, "avg_risk_per_opportunity": 0.0, "max_risk_opportunity": None, "risk_distribution": {}}
     
-    def _determine_market_sentiment(self, opportunities: List[TradingOpportunity]) -> str:
-        """Determine overall market sentiment."""
-        try:
-            if not opportunities:
-                return "NEUTRAL"
-            
-            buy_signals = sum(1 for opp in opportunities if opp.signal_type == "BUY")
-            sell_signals = sum(1 for opp in opportunities if opp.signal_type in ["SELL", "SHORT"])
-            
-            total_signals = len(opportunities)
-            buy_ratio = buy_signals / total_signals
-            
-            if buy_ratio > 0.6:
-                return "BULLISH"
-            elif buy_ratio < 0.4:
-                return "BEARISH"
-            else:
-                return "NEUTRAL"
-                
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "determine_market_sentiment"})
-            return "UNKNOWN"
+    def _determine_market_sentiment(self, aggregates: _DailyAggregates) -> str:
+        """Determine overall market sentiment from the day's already-counted signals."""
+        if not aggregates.count:
+            return "NEUTRAL"
+        
+        buy_ratio = int(aggregates.signal_counts[_SIG_BUY]) / aggregates.count
+        
+        if buy_ratio > 0.6:
+            return "BULLISH"
+        elif buy_ratio < 0.4:
+            return "BEARISH"
+        else:
+            return "NEUTRAL"
     
     def _get_sector_from_symbol(self, symbol: str) -> str:
         """Get sector from symbol (simplified mapping)."""
-        try:
-            # Simplified sector mapping
-            sector_mapping = {
-                "RELIANCE": "OIL_GAS",
-                "TCS": "IT",
-                "HDFC": "BANKING",
-                "INFY": "IT",
-                "ICICIBANK": "BANKING",
-                "NIFTY": "INDEX",
-                "BANKNIFTY": "INDEX"
-            }
-            
-            return sector_mapping.get(symbol, "OTHERS")
-            
-        except Exception:
-            return "OTHERS"
+        return _SECTOR_MAP.get(symbol, "OTHERS")
+    
+    def _get_sector_id(self, symbol: str) -> int:
+        """Get the interned sector id for a symbol, resolving each symbol once."""
+        sector_id = self._sector_cache.get(symbol)
+        if sector_id is None:
+            sector_id = _intern_id(self._sector_ids, self._sector_names, self._get_sector_from_symbol(symbol))
+            self._sector_cache[symbol] = sector_id
+        return sector_id
     
     def _generate_empty_report(self, date: str) -> EODReport:
         """Generate an empty report when no data is available."""
         return EODReport(
             report_date=date,
             market_sentiment="NO_DATA",
-            scan_summary=DailyOpportunitySummary(
-                date=date,
-                total_stocks_scanned=0,
-                opportunities_found=0,
-                buy_signals=0,
-                sell_signals=0,
-                short_signals=0,
-                avg_confidence_score=0.0,
-                avg_risk_reward_ratio=0.0,
-                top_opportunities=[],
-                sector_breakdown={},
-                strategy_performance={}
-            ),
+            scan_summary=_empty_summary(date),
             missed_opportunities=[],
             strategy_analysis={},
             market_analysis={"market_condition": "NO_DATA", "volatility": "UNKNOWN"},
@@ -493,21 +582,31 @@ class EODSummaryGenerator:
         )
     
     def _cleanup_old_data(self):
-        """Clean up old data based on retention policy."""
+        """Clean up old data based on retention policy (runs on the background worker)."""
         try:
             cutoff_date = datetime.now() - timedelta(days=self.report_retention_days)
-            
-            # Clean up old opportunities
-            self.opportunity_history = [
-                opp for opp in self.opportunity_history
-                if opp.timestamp > cutoff_date
-            ]
-            
-            # Clean up old reports
-            self.daily_reports = [
-                report for report in self.daily_reports
-                if datetime.strptime(report.report_date, "%Y-%m-%d").date() > cutoff_date.date()
-            ]
+            cutoff_ordinal = cutoff_date.toordinal()
+            
+            with self._data_lock:
+                # Opportunities arrive in time order, so expired rows form a prefix
+                expired = self._ts[:self._n_rows] <= cutoff_date.timestamp()
+                dropped = self._n_rows if expired.all() else int(expired.argmin())
+                if dropped:
+                    remaining = self._n_rows - dropped
+                    del self.opportunity_history[:dropped]
+                    for name in _COLUMNS:
+                        column = getattr(self, name)
+                        column[:remaining] = column[dropped:self._n_rows]
+                    self._n_rows = remaining
+                    self._row_base += dropped
+                    
+                    for ordinal in [ordinal for ordinal in self._by_date if ordinal < cutoff_ordinal]:
+                        del self._by_date[ordinal]
+                
+                # Clean up old reports
+                while self.daily_reports and _parse_ymd(self.daily_reports[0].report_date) <= cutoff_ordinal:
+                    self.daily_reports.popleft()
+                    self._reports_version += 1
             
         except Exception as e:
             self.logger.log_error(e, {"operation": "cleanup_old_data"})
@@ -518,12 +617,15 @@ class EODSummaryGenerator:
             if filepath is None:
                 filepath = f"eod_report_{report.report_date}.json"
             
-            # Convert report to dictionary
-            report_dict = asdict(report)
+            # orjson walks the dataclasses natively, skipping the asdict() deep copy
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(asdict(report), indent=2, default=str).encode()
             
             # Write to file
-            with open(filepath, 'w') as f:
-                json.dump(report_dict, f, indent=2, default=str)
+            with open(filepath, 'wb') as f:
+                f.write(payload)
             
             self.logger.info(f"EOD report exported to {filepath}")
             return filepath
@@ -532,25 +634,43 @@ class EODSummaryGenerator:
             self.logger.log_error(e, {"operation": "export_report_to_json"})
             return ""
     
+    async def aexport_report_to_json(self, report: EODReport, filepath: str = None) -> str:
+        """Async variant of export_report_to_json; the file write runs on the background worker."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._background, self.export_report_to_json, report, filepath)
+    
     def get_report_summary(self, date: str = None) -> Dict[str, Any]:
         """Get a summary of the latest report."""
         try:
             if date is None:
                 date = datetime.now().strftime("%Y-%m-%d")
             
-            # Find the report for the specified date
-            for report in reversed(self.daily_reports):
-                if report.report_date == date:
-                    return {
-                        "date": report.report_date,
-                        "market_sentiment": report.market_sentiment,
-                        "opportunities_found": report.scan_summary.opportunities_found,
-                        "avg_confidence": report.scan_summary.avg_confidence_score,
-                        "top_opportunity": report.scan_summary.top_opportunities[0] if report.scan_summary.top_opportunities else None,
-                        "recommendations_count": len(report.recommendations)
-                    }
-            
-            return {"error": f"No report found for date: {date}"}
+            # Find the latest report for the specified date
+            with self._data_lock:
+                cache_key = (date, self._reports_version)
+                cached = self._summary_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+                report = next((r for r in reversed(self.daily_reports) if r.report_date == date), None)
+            
+            if report is None:
+                summary = {"error": f"No report found for date: {date}"}
+            else:
+                summary = {
+                    "date": report.report_date,
+                    "market_sentiment": report.market_sentiment,
+                    "opportunities_found": report.scan_summary.opportunities_found,
+                    "avg_confidence": report.scan_summary.avg_confidence_score,
+                    "top_opportunity": report.scan_summary.top_opportunities[0] if report.scan_summary.top_opportunities else None,
+                    "recommendations_count": len(report.recommendations)
+                }
+            
+            # Keep only the few most recent lookups
+            with self._data_lock:
+                self._summary_cache[cache_key] = summary
+                if len(self._summary_cache) > 4:
+                    self._summary_cache.pop(next(iter(self._summary_cache)))
+            return summary
             
         except Exception as e:
             self.logger.log_error(e, {"operation": "get_report_summary"})
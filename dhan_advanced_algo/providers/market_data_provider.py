@@ -3,20 +3,32 @@ Market Data Provider implementation.
 Handles market data fetching, caching, and management from various sources.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
+from collections import OrderedDict
 from decimal import Decimal
 from datetime import datetime, timedelta
 import asyncio
+import heapq
 import json
+import sys
+import threading
+import time
+import weakref
 
 from ..core.interfaces import IMarketDataProvider
-from ..core.entities import MarketData, OHLCV, Symbol
+from ..core.entities import MarketData, MarketDataFrame, OHLCV, Symbol
 from ..core.exceptions import MarketDataException
 from ..core.logging_service import LoggingService
 from ..core.config import ConfigurationManager
 from .dhan_market_data_provider import DhanMarketDataProvider
 
 
+def _ltp_market_data(symbol: str, ltp: Decimal, timestamp: datetime) -> MarketData:
+    """Build market data from an LTP alone (LTP doubles as OHLC, volume unknown)."""
+    # Positional: symbol, ltp, open, high, low, close, volume, timestamp
+    return MarketData(symbol, ltp, ltp, ltp, ltp, ltp, 0, timestamp)
+
+
 class MarketDataProvider(IMarketDataProvider):
     """
     Market data provider implementation.
@@ -35,19 +47,41 @@ class MarketDataProvider(IMarketDataProvider):
         self.logger = LoggingService()
 
         # Data storage
-        self.market_data_cache: Dict[str, MarketData] = {}
-        self.ohlcv_cache: Dict[str, List[OHLCV]] = {}
+        self.market_data_cache: "OrderedDict[str, MarketData]" = OrderedDict()  # Oldest write first
+        self._expiry: Dict[str, float] = {}  # Symbol -> monotonic expiry of its cache entry
+        self._expiry_heap: List[Tuple[float, str]] = []  # (expiry, symbol); stale pairs dropped lazily
+        self.ohlcv_cache: Dict[Tuple[str, str, int], MarketDataFrame] = {}  # Candles kept column-wise
         self.symbols: Dict[str, Symbol] = {}
+        self._subscribed: Set[str] = set()  # Symbols kept fresh by refresh_cache
+        self._subscription_count = 0  # Subscribe calls, summarised in the log every 1000
         
         # Configuration
         self.cache_timeout_seconds = getattr(config.market_data, 'cache_timeout_seconds', 300)
         self.max_cache_size = getattr(config.market_data, 'max_cache_size', 1000)
         self.update_interval_seconds = getattr(config.market_data, 'update_interval_seconds', 60)
+        self.active_update_interval_seconds = getattr(config.market_data, 'active_update_interval_seconds', 10)
+        self.idle_update_interval_seconds = getattr(config.market_data, 'idle_update_interval_seconds', 300)
+        self._base_cache_timeout_seconds = self.cache_timeout_seconds
+        self.max_concurrency = getattr(config.market_data, 'max_concurrency', 40)
+        self.batch_size = getattr(config.market_data, 'batch_size', 200)
+
+        # The caches above are shared with the update thread (sync mode), so
+        # every access goes through this lock; it is never held across an await
+        self._cache_lock = threading.Lock()
+
+        # Caps in-flight Dhan requests; asyncio primitives belong to one event
+        # loop, so each loop that fetches gets its own semaphore
+        self._fetch_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
 
         # Connection status
         self.is_connected = False
         self.last_update = None
+        self._last_update_iso: Optional[str] = None  # last_update.isoformat(), formatted once per update
         self.update_task = None
+        self.update_thread: Optional[threading.Thread] = None  # Used when started outside an event loop
+        self._update_thread_loop: Optional[asyncio.AbstractEventLoop] = None  # The update thread's event loop
 
         # Initialize Dhan provider if client is available
         self.dhan_provider = None
@@ -88,13 +122,13 @@ class MarketDataProvider(IMarketDataProvider):
             # Try to connect to Dhan provider first
             if self.dhan_provider:
                 self.is_connected = True
-                self.last_update = datetime.now()
+                self._mark_updated()
                 self.logger.info("Connected to Dhan market data source")
                 return True
             
             # Fallback to basic connection
             self.is_connected = True
-            self.last_update = datetime.now()
+            self._mark_updated()
             self.logger.info("Connected to market data source (basic mode)")
             return True
 
@@ -116,6 +150,7 @@ class MarketDataProvider(IMarketDataProvider):
                 self.update_task = None
 
             self.is_connected = False
+            self._stop_update_thread()
             self.logger.info("Disconnected from market data source")
             return True
 
@@ -123,6 +158,21 @@ class MarketDataProvider(IMarketDataProvider):
             self.logger.log_error(e, {"operation": "disconnect"})
             return False
 
+    async def aclose(self) -> None:
+        """
+        Disconnect and release the Dhan provider's pooled resources.
+
+        Waits for the update task to finish cancelling. The provider
+        cannot fetch data again after this.
+        """
+        update_task = self.update_task
+        self.disconnect()
+        if update_task:
+            await asyncio.gather(update_task, return_exceptions=True)
+
+        if self.dhan_provider:
+            self.dhan_provider.close()
+
     def get_market_data(self, symbol: str) -> Optional[MarketData]:
         """
         Get market data for a symbol.
@@ -135,47 +185,106 @@ class MarketDataProvider(IMarketDataProvider):
         """
         try:
             # Check cache first
-            if symbol in self.market_data_cache:
-                cached_data = self.market_data_cache[symbol]
-                if self._is_cache_valid(cached_data):
-                    return cached_data
+            with self._cache_lock:
+                if self._expiry.get(symbol, 0.0) > time.monotonic():
+                    return self.market_data_cache[symbol]
 
             # Try to get data from Dhan provider
             if self.dhan_provider and self.is_connected:
-                try:
-                    # Get LTP from Dhan provider
-                    ltp = self.dhan_provider.get_ltp(symbol)
-                    if ltp is not None:
-                        # Create market data from LTP
-                        market_data = MarketData(
-                            symbol=symbol,
-                            ltp=ltp,
-                            open_price=ltp,  # Use LTP as fallback
-                            high_price=ltp,
-                            low_price=ltp,
-                            close_price=ltp,
-                            volume=0,  # Not available from LTP
-                            timestamp=datetime.now()
-                        )
-                        
-                        # Update cache
-                        self._update_cache(symbol, market_data)
-                        return market_data
-                except Exception as e:
-                    self.logger.warning(f"Failed to get data from Dhan provider for {symbol}: {e}")
+                ltp = self.dhan_provider.get_ltp(symbol)
+                if ltp is not None:
+                    market_data = _ltp_market_data(symbol, ltp, datetime.now())
+                    self._update_cache(symbol, market_data)
+                    return market_data
 
-            # Return cached data if available (even if expired)
-            if symbol in self.market_data_cache:
-                return self.market_data_cache[symbol]
+        except Exception as e:
+            self.logger.warning(f"Failed to get data from Dhan provider for {symbol}: {e}")
 
-            return None
+        # Return cached data if available (even if expired)
+        with self._cache_lock:
+            return self.market_data_cache.get(symbol)
+
+    async def aget_market_data(self, symbol: str) -> Optional[MarketData]:
+        """
+        Async variant of get_market_data.
+
+        The LTP is fetched through the Dhan provider's aget_ltp, so the
+        blocking client never runs on the event loop.
+        """
+        try:
+            # Check cache first
+            with self._cache_lock:
+                if self._expiry.get(symbol, 0.0) > time.monotonic():
+                    return self.market_data_cache[symbol]
+
+            # Try to get data from Dhan provider
+            market_data = await self._fetch_one(symbol)
+            if market_data:
+                return market_data
 
         except Exception as e:
-            self.logger.log_error(e, {
-                "operation": "get_market_data",
-                "symbol": symbol
-            })
-            return None
+            self.logger.warning(f"Failed to get data from Dhan provider for {symbol}: {e}")
+
+        # Return cached data if available (even if expired)
+        with self._cache_lock:
+            return self.market_data_cache.get(symbol)
+
+    async def get_market_data_batch(self, symbols: Iterable[str],
+                                    now: Optional[float] = None) -> Dict[str, MarketData]:
+        """
+        Get market data for several symbols at once.
+
+        Symbols with a valid cache entry are answered from the cache; the
+        LTPs for the rest are fetched concurrently.
+
+        Args:
+            symbols: Trading symbols
+            now: time.monotonic() reading to use for the whole batch
+
+        Returns:
+            Dictionary of symbol to market data for the symbols that resolved
+        """
+        results: Dict[str, MarketData] = {}
+        missing = []
+        expiry = self._expiry
+        if now is None:
+            now = time.monotonic()
+
+        with self._cache_lock:
+            for symbol in symbols:
+                if expiry.get(symbol, 0.0) > now:
+                    results[symbol] = self.market_data_cache[symbol]
+                else:
+                    missing.append(symbol)
+
+        if not missing:
+            return results
+
+        # Quotes fetched in this batch share one wall-clock timestamp
+        timestamp = datetime.now()
+
+        # Schedule one batch at a time so a large symbol list does not
+        # create thousands of pending coroutines up front
+        fetched = []
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            fetched.extend(await asyncio.gather(
+                *(self._fetch_one(symbol, now, timestamp) for symbol in batch),
+                return_exceptions=True
+            ))
+
+        for symbol, market_data in zip(missing, fetched):
+            if isinstance(market_data, Exception):
+                self.logger.warning(f"Failed to get data from Dhan provider for {symbol}: {market_data}")
+                market_data = None
+            if market_data is None:
+                # Fall back to the expired entry, as get_market_data does
+                with self._cache_lock:
+                    market_data = self.market_data_cache.get(symbol)
+            if market_data is not None:
+                results[symbol] = market_data
+
+        return results
 
     def get_ohlcv(self, symbol: str, interval: str = "1D", 
                    limit: int = 100) -> List[OHLCV]:
@@ -191,40 +300,8 @@ class MarketDataProvider(IMarketDataProvider):
             List of OHLCV data
         """
         try:
-            cache_key = f"{symbol}_{interval}_{limit}"
-            
-            # Check cache first
-            if cache_key in self.ohlcv_cache:
-                cached_data = self.ohlcv_cache[cache_key]
-                if cached_data and len(cached_data) > 0:
-                    return cached_data
-
-            # Try to get data from Dhan provider
-            if self.dhan_provider and self.is_connected:
-                try:
-                    historical_data = self.dhan_provider.get_historical_data(symbol, interval, limit)
-                    if historical_data:
-                        # Convert to OHLCV format
-                        ohlcv_data = []
-                        for data in historical_data:
-                            ohlcv = OHLCV(
-                                timestamp=data.timestamp,
-                                open_price=data.open_price,
-                                high_price=data.high_price,
-                                low_price=data.low_price,
-                                close_price=data.close_price,
-                                volume=data.volume
-                            )
-                            ohlcv_data.append(ohlcv)
-                        
-                        # Update cache
-                        self._update_ohlcv_cache(cache_key, ohlcv_data)
-                        return ohlcv_data
-                except Exception as e:
-                    self.logger.warning(f"Failed to get OHLCV from Dhan provider for {symbol}: {e}")
-
-            # Return empty list if no data available
-            return []
+            frame = self.get_ohlcv_frame(symbol, interval, limit)
+            return frame.to_ohlcv() if len(frame) > 0 else []
 
         except Exception as e:
             self.logger.log_error(e, {
@@ -234,6 +311,66 @@ class MarketDataProvider(IMarketDataProvider):
             })
             return []
 
+    def get_ohlcv_frame(self, symbol: str, interval: str = "1D",
+                        limit: int = 100) -> MarketDataFrame:
+        """
+        Get OHLCV data for a symbol as columnar arrays.
+
+        This is the cached form behind get_ohlcv; indicator code should
+        prefer it to avoid building one object per candle.
+
+        Args:
+            symbol: Trading symbol
+            interval: Time interval (1D, 1H, 15M, etc.)
+            limit: Number of candles to return
+
+        Returns:
+            MarketDataFrame, empty if no data is available
+        """
+        # Interval names repeat across every symbol; interning keeps one copy
+        interval = sys.intern(interval)
+        cache_key = (symbol, interval, limit)
+
+        # Check cache first
+        with self._cache_lock:
+            cached_data = self.ohlcv_cache.get(cache_key)
+        if cached_data is not None and len(cached_data) > 0:
+            return cached_data
+
+        # Try to get data from Dhan provider
+        if self.dhan_provider and self.is_connected:
+            try:
+                frame = self.dhan_provider.get_historical_frame(symbol, interval, limit)
+                if frame is not None and len(frame) > 0:
+                    self._update_ohlcv_cache(cache_key, frame)
+                    return frame
+            except Exception as e:
+                self.logger.warning(f"Failed to get OHLCV from Dhan provider for {symbol}: {e}")
+
+        # Return empty frame if no data available
+        return MarketDataFrame(symbol=symbol)
+
+    async def get_ohlcv_multi(self, symbol: str, intervals: List[str],
+                              limit: int = 100) -> Dict[str, MarketDataFrame]:
+        """
+        Get OHLCV data for one symbol across several intervals.
+
+        Uncached intervals are fetched concurrently, sharing the fetch
+        semaphore with the LTP batch.
+
+        Args:
+            symbol: Trading symbol
+            intervals: Time intervals (1D, 1H, 15M, etc.)
+            limit: Number of candles to return per interval
+
+        Returns:
+            Dictionary of interval to MarketDataFrame (empty if unavailable)
+        """
+        frames = await asyncio.gather(
+            *(self._afetch_ohlcv_frame(symbol, interval, limit) for interval in intervals)
+        )
+        return dict(zip(intervals, frames))
+
     def get_symbols(self, exchange: Optional[str] = None) -> List[Symbol]:
         """
         Get available trading symbols.
@@ -272,9 +409,20 @@ class MarketDataProvider(IMarketDataProvider):
             True if subscribed successfully, False otherwise
         """
         try:
-            # For now, just log the subscription
-            # In a real implementation, this would establish a websocket connection
-            self.logger.info(f"Subscribed to symbol: {symbol}")
+            # No tick feed is attached here yet; a websocket client for the
+            # symbol should deliver its ticks to on_tick, which keeps the
+            # cache entry current between refresh cycles
+            self._subscribed.add(symbol)
+
+            # Per-symbol lines only at DEBUG; bulk subscribes log a running total
+            if self.logger.is_enabled_for('DEBUG'):
+                self.logger.debug(f"Subscribed to symbol: {symbol}")
+            self._subscription_count += 1
+            if self._subscription_count % 1000 == 0:
+                self.logger.info(
+                    f"Processed {self._subscription_count} subscriptions, "
+                    f"{len(self._subscribed)} symbols subscribed"
+                )
             return True
 
         except Exception as e:
@@ -284,6 +432,25 @@ class MarketDataProvider(IMarketDataProvider):
             })
             return False
 
+    async def on_tick(self, symbol: str, ltp: Decimal,
+                      timestamp: Optional[datetime] = None) -> None:
+        """
+        Apply a pushed tick to the market data cache.
+
+        The cache entry is replaced in place and its expiry pushed out, so
+        symbols with a live feed are served from the cache and skipped by
+        refresh_cache. The TTL only takes effect once ticks stop arriving.
+
+        Args:
+            symbol: Trading symbol
+            ltp: Last traded price from the tick
+            timestamp: Exchange time of the tick (defaults to now)
+        """
+        if not isinstance(ltp, Decimal):
+            ltp = Decimal(str(ltp))
+
+        self._update_cache(symbol, _ltp_market_data(symbol, ltp, timestamp or datetime.now()))
+
     def unsubscribe_symbol(self, symbol: str) -> bool:
         """
         Unsubscribe from market data updates for a symbol.
@@ -295,8 +462,9 @@ class MarketDataProvider(IMarketDataProvider):
             True if unsubscribed successfully, False otherwise
         """
         try:
-            # For now, just log the unsubscription
-            self.logger.info(f"Unsubscribed from symbol: {symbol}")
+            self._subscribed.discard(symbol)
+            if self.logger.is_enabled_for('DEBUG'):
+                self.logger.debug(f"Unsubscribed from symbol: {symbol}")
             return True
 
         except Exception as e:
@@ -324,7 +492,7 @@ class MarketDataProvider(IMarketDataProvider):
             # Return basic status
             return {
                 "status": "unknown",
-                "last_update": self.last_update.isoformat() if self.last_update else None,
+                "last_update": self._last_update_iso,
                 "connected": self.is_connected
             }
 
@@ -332,10 +500,13 @@ class MarketDataProvider(IMarketDataProvider):
             self.logger.log_error(e, {"operation": "get_market_status"})
             return {"status": "error", "error": str(e)}
 
-    def refresh_cache(self) -> int:
+    async def refresh_cache(self, now: Optional[float] = None) -> int:
         """
         Refresh market data cache.
 
+        Args:
+            now: time.monotonic() reading for this update tick (optional)
+
         Returns:
             Number of symbols refreshed
         """
@@ -343,18 +514,12 @@ class MarketDataProvider(IMarketDataProvider):
             if not self.is_connected:
                 return 0
 
-            refreshed_count = 0
-            
-            # Refresh symbols that are subscribed
-            for symbol in list(self.symbols.keys()):
-                try:
-                    market_data = self.get_market_data(symbol)
-                    if market_data:
-                        refreshed_count += 1
-                except Exception as e:
-                    self.logger.warning(f"Failed to refresh data for {symbol}: {e}")
+            # Refresh symbols that are subscribed; a copy, since other threads
+            # may subscribe while the batch is awaited
+            refreshed = await self.get_market_data_batch(tuple(self._subscribed), now)
+            refreshed_count = len(refreshed)
 
-            self.last_update = datetime.now()
+            self._mark_updated()
             self.logger.debug(f"Refreshed {refreshed_count} symbols")
             return refreshed_count
 
@@ -362,49 +527,19 @@ class MarketDataProvider(IMarketDataProvider):
             self.logger.log_error(e, {"operation": "refresh_cache"})
             return 0
 
-    def cleanup_cache(self) -> int:
+    def cleanup_cache(self, now: Optional[float] = None) -> int:
         """
         Clean up expired cache entries.
 
+        Args:
+            now: time.monotonic() reading for this update tick (optional)
+
         Returns:
             Number of entries cleaned up
         """
         try:
-            cleaned_count = 0
-            current_time = datetime.now()
-
-            # Clean up market data cache
-            expired_symbols = []
-            for symbol, data in self.market_data_cache.items():
-                if not self._is_cache_valid(data):
-                    expired_symbols.append(symbol)
-
-            for symbol in expired_symbols:
-                del self.market_data_cache[symbol]
-                cleaned_count += 1
-
-            # Clean up OHLCV cache
-            expired_ohlcv_keys = []
-            for key, data in self.ohlcv_cache.items():
-                if not data or len(data) == 0:
-                    expired_ohlcv_keys.append(key)
-
-            for key in expired_ohlcv_keys:
-                del self.ohlcv_cache[key]
-                cleaned_count += 1
-
-            # Limit cache size
-            if len(self.market_data_cache) > self.max_cache_size:
-                # Remove oldest entries
-                sorted_cache = sorted(
-                    self.market_data_cache.items(),
-                    key=lambda x: x[1].timestamp
-                )
-                excess_count = len(self.market_data_cache) - self.max_cache_size
-                for i in range(excess_count):
-                    symbol = sorted_cache[i][0]
-                    del self.market_data_cache[symbol]
-                    cleaned_count += 1
+            with self._cache_lock:
+                cleaned_count = self._cleanup_locked(time.monotonic() if now is None else now)
 
             if cleaned_count > 0:
                 self.logger.debug(f"Cleaned up {cleaned_count} cache entries")
@@ -415,6 +550,36 @@ class MarketDataProvider(IMarketDataProvider):
             self.logger.log_error(e, {"operation": "cleanup_cache"})
             return 0
 
+    def _cleanup_locked(self, now: float) -> int:
+        """Drop expired and excess cache entries; the caller holds _cache_lock."""
+        cleaned_count = 0
+
+        # Clean up market data cache: only entries at the top of the
+        # heap can have expired. A popped pair whose expiry no longer
+        # matches was superseded by a later write (or evicted) and is
+        # simply dropped.
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry, symbol = heapq.heappop(heap)
+            if self._expiry.get(symbol) == expiry:
+                del self._expiry[symbol]
+                self.market_data_cache.pop(symbol, None)
+                cleaned_count += 1
+
+        # Limit cache size by removing the oldest entries
+        while len(self.market_data_cache) > self.max_cache_size:
+            symbol, _ = self.market_data_cache.popitem(last=False)
+            self._expiry.pop(symbol, None)
+            cleaned_count += 1
+
+        # Only non-empty frames are cached, so the OHLCV cache just
+        # needs trimming (oldest insert first) once it outgrows the limit
+        while len(self.ohlcv_cache) > self.max_cache_size:
+            del self.ohlcv_cache[next(iter(self.ohlcv_cache))]
+            cleaned_count += 1
+
+        return cleaned_count
+
     def _load_symbols(self) -> None:
         """Load available trading symbols."""
         try:
@@ -431,27 +596,30 @@ class MarketDataProvider(IMarketDataProvider):
             if not self.symbols:
                 basic_symbols = [
                     Symbol(
-                        symbol_id="NIFTY50",
+                        symbol="NIFTY50",
                         name="NIFTY 50",
                         exchange="NSE",
                         instrument_type="INDEX",
                         lot_size=50,
-                        tick_size=Decimal("0.05"),
+                        tick_size=0.05,
                         is_active=True
                     ),
                     Symbol(
-                        symbol_id="BANKNIFTY",
+                        symbol="BANKNIFTY",
                         name="BANK NIFTY",
                         exchange="NSE",
                         instrument_type="INDEX",
                         lot_size=25,
-                        tick_size=Decimal("0.05"),
+                        tick_size=0.05,
                         is_active=True
                     )
                 ]
 
                 for symbol in basic_symbols:
-                    self.symbols[symbol.symbol_id] = symbol
+                    self.symbols[symbol.symbol] = symbol
+
+            # Loaded symbols are refreshed until explicitly unsubscribed
+            self._subscribed.update(self.symbols)
 
             self.logger.info(f"Loaded {len(self.symbols)} symbols")
 
@@ -461,38 +629,104 @@ class MarketDataProvider(IMarketDataProvider):
     def _initialize_cache(self) -> None:
         """Initialize data cache."""
         try:
-            self.market_data_cache.clear()
-            self.ohlcv_cache.clear()
+            with self._cache_lock:
+                self.market_data_cache.clear()
+                self._expiry.clear()
+                self._expiry_heap.clear()
+                self.ohlcv_cache.clear()
             self.logger.debug("Market data cache initialized")
 
         except Exception as e:
             self.logger.log_error(e, {"operation": "initialize_cache"})
 
     def _start_update_loop(self) -> None:
-        """Start the data update loop."""
+        """
+        Start the data update loop.
+
+        Called from a coroutine, the loop runs as a task on the caller's
+        event loop. Called from synchronous code (no running loop), it runs
+        on a daemon thread with its own event loop instead; disconnect()
+        stops and joins that thread.
+        """
         try:
-            if self.update_task:
-                self.update_task.cancel()
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+
+            if loop is not None:
+                if self.update_task:
+                    self.update_task.cancel()
+                self.update_task = loop.create_task(self._update_loop())
+            elif self.update_thread is None or not self.update_thread.is_alive():
+                # The loop is created here so disconnect() can always reach it
+                self._update_thread_loop = asyncio.new_event_loop()
+                self.update_thread = threading.Thread(
+                    target=self._run_update_thread,
+                    args=(self._update_thread_loop,),
+                    name="market-data-update",
+                    daemon=True
+                )
+                self.update_thread.start()
 
-            self.update_task = asyncio.create_task(self._update_loop())
             self.logger.debug("Market data update loop started")
 
         except Exception as e:
             self.logger.log_error(e, {"operation": "start_update_loop"})
 
+    def _run_update_thread(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Run the update loop on the update thread's own event loop."""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._update_loop())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.close()
+
+    def _stop_update_thread(self, timeout: float = 10.0) -> None:
+        """Cancel the update thread's loop and wait for the thread to exit."""
+        thread, loop = self.update_thread, self._update_thread_loop
+        self.update_thread = None
+        self._update_thread_loop = None
+        if thread is None:
+            return
+
+        if loop is not None:
+            try:
+                # Cancelling wakes the loop from its sleep instead of waiting it out
+                loop.call_soon_threadsafe(self._cancel_loop_tasks, loop)
+            except RuntimeError:
+                pass  # The loop already finished and closed
+
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+            if thread.is_alive():
+                self.logger.warning("Market data update thread did not stop in time")
+
+    @staticmethod
+    def _cancel_loop_tasks(loop: asyncio.AbstractEventLoop) -> None:
+        """Cancel every task on the loop; runs on that loop's thread."""
+        for task in asyncio.all_tasks(loop):
+            task.cancel()
+
     async def _update_loop(self) -> None:
         """Main update loop for market data."""
         try:
             while self.is_connected:
                 try:
+                    # One clock reading serves the whole tick
+                    now = time.monotonic()
+
                     # Refresh cache
-                    self.refresh_cache()
+                    await self.refresh_cache(now)
                     
-                    # Clean up old cache entries
-                    self.cleanup_cache()
+                    # Clean up old cache entries, only when there is work to do
+                    if self._cleanup_due(now):
+                        self.cleanup_cache(now)
                     
                     # Wait for next update
-                    await asyncio.sleep(self.update_interval_seconds)
+                    await asyncio.sleep(self._adaptive_interval())
                     
                 except asyncio.CancelledError:
                     break
@@ -503,37 +737,107 @@ class MarketDataProvider(IMarketDataProvider):
         except Exception as e:
             self.logger.log_error(e, {"operation": "update_loop"})
 
-    def _update_cache(self, symbol: str, market_data: MarketData) -> None:
-        """Update market data cache."""
-        try:
-            self.market_data_cache[symbol] = market_data
+    def _cleanup_due(self, now: float) -> bool:
+        """Check whether an entry has expired or a cache is over its size limit."""
+        with self._cache_lock:
+            return (
+                (bool(self._expiry_heap) and self._expiry_heap[0][0] <= now)
+                or len(self.market_data_cache) > self.max_cache_size
+                or len(self.ohlcv_cache) > self.max_cache_size
+            )
+
+    def _mark_updated(self) -> None:
+        """Record the time of the latest connect or refresh."""
+        self.last_update = datetime.now()
+        self._last_update_iso = self.last_update.isoformat()
+
+    def _adaptive_interval(self) -> float:
+        """
+        Pick the next update delay from the market phase.
 
-        except Exception as e:
-            self.logger.log_error(e, {
-                "operation": "update_cache",
-                "symbol": symbol
-            })
+        Refreshes run often while the market is open and rarely once it is
+        closed. The cache TTL is scaled by the same factor, so entries
+        written during the session expire sooner than those written after
+        the close.
+        """
+        if not self.dhan_provider:
+            return self.update_interval_seconds
 
-    def _update_ohlcv_cache(self, key: str, ohlcv_data: List[OHLCV]) -> None:
-        """Update OHLCV cache."""
-        try:
-            self.ohlcv_cache[key] = ohlcv_data
+        if self.dhan_provider.is_market_open():
+            interval = self.active_update_interval_seconds
+        else:
+            interval = self.idle_update_interval_seconds
 
-        except Exception as e:
-            self.logger.log_error(e, {
-                "operation": "update_ohlcv_cache",
-                "key": key
-            })
+        self.cache_timeout_seconds = (
+            self._base_cache_timeout_seconds * interval / self.update_interval_seconds
+        )
+        return interval
 
-    def _is_cache_valid(self, market_data: MarketData) -> bool:
-        """Check if cached market data is still valid."""
-        try:
-            if not market_data or not market_data.timestamp:
-                return False
+    async def _fetch_one(self, symbol: str, now: Optional[float] = None,
+                         timestamp: Optional[datetime] = None) -> Optional[MarketData]:
+        """
+        Fetch the LTP for a symbol from Dhan and cache it as market data.
 
-            age = datetime.now() - market_data.timestamp
-            return age.total_seconds() < self.cache_timeout_seconds
+        Batch callers pass their monotonic and wall-clock readings so the
+        clock is read once per batch rather than once per symbol.
+        """
+        if not (self.dhan_provider and self.is_connected):
+            return None
 
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "is_cache_valid"})
-            return False 
\ No newline at end of file
+        # The Dhan client is blocking; aget_ltp runs it on the provider's pool
+        async with self._fetch_semaphore():
+            ltp = await self.dhan_provider.aget_ltp(symbol)
+        if ltp is None:
+            return None
+
+        # Create market data from LTP
+        market_data = _ltp_market_data(symbol, ltp, timestamp or datetime.now())
+
+        # Update cache
+        self._update_cache(symbol, market_data, now)
+        return market_data
+
+    async def _afetch_ohlcv_frame(self, symbol: str, interval: str, limit: int) -> MarketDataFrame:
+        """Async counterpart of get_ohlcv_frame used by get_ohlcv_multi."""
+        interval = sys.intern(interval)
+        cache_key = (symbol, interval, limit)
+
+        with self._cache_lock:
+            cached_data = self.ohlcv_cache.get(cache_key)
+        if cached_data is not None and len(cached_data) > 0:
+            return cached_data
+
+        if self.dhan_provider and self.is_connected:
+            try:
+                async with self._fetch_semaphore():
+                    frame = await self.dhan_provider.aget_historical_frame(symbol, interval, limit)
+                if frame is not None and len(frame) > 0:
+                    self._update_ohlcv_cache(cache_key, frame)
+                    return frame
+            except Exception as e:
+                self.logger.warning(f"Failed to get OHLCV from Dhan provider for {symbol}: {e}")
+
+        return MarketDataFrame(symbol=symbol)
+
+    def _update_cache(self, symbol: str, market_data: MarketData,
+                      now: Optional[float] = None) -> None:
+        """Update market data cache."""
+        expiry = (time.monotonic() if now is None else now) + self.cache_timeout_seconds
+        with self._cache_lock:
+            self.market_data_cache[symbol] = market_data
+            self.market_data_cache.move_to_end(symbol)
+            self._expiry[symbol] = expiry
+            heapq.heappush(self._expiry_heap, (expiry, symbol))
+
+    def _update_ohlcv_cache(self, key: Tuple[str, str, int], ohlcv_data: MarketDataFrame) -> None:
+        """Update OHLCV cache."""
+        with self._cache_lock:
+            self.ohlcv_cache[key] = ohlcv_data
+
+    def _fetch_semaphore(self) -> asyncio.Semaphore:
+        """Get the fetch semaphore for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._fetch_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._fetch_semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore 
\ No newline at end of file
@@ -5,9 +5,13 @@ Continuously scans the entire market for trading opportunities based on defined
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numpy as np
 import pandas as pd
 
 from ..core.interfaces import IMarketDataProvider
@@ -15,11 +19,12 @@ from ..core.entities import MarketData, OHLCV
 from ..core.logging_service import LoggingService
 from ..core.config import ConfigurationManager
 from .strategy_manager import StrategyManager
+from .strategy_engine import StrategyEngine, OHLCV_COLUMNS
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingOpportunity:
-    """Represents a detected trading opportunity."""
+    """Represents a detected trading opportunity (immutable)."""
     symbol: str
     strategy_name: str
     strategy_id: str
@@ -31,17 +36,17 @@ class TradingOpportunity:
     risk_reward_ratio: float
     volume: int
     timestamp: datetime
-    indicators: Dict[str, Any]
+    indicators: Dict[str, Any] = field(hash=False)
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketScanResult:
-    """Result of a market scan operation."""
+    """Result of a market scan operation (immutable)."""
     scan_timestamp: datetime
     total_stocks_scanned: int
     opportunities_found: int
-    opportunities: List[TradingOpportunity]
+    opportunities: List[TradingOpportunity] = field(hash=False)
     scan_duration: float
     market_sentiment: str  # 'BULLISH', 'BEARISH', 'NEUTRAL'
 
@@ -74,6 +79,23 @@ class MarketScanner:
         self.max_concurrent_scans = getattr(config.market_scanner, 'max_concurrent_scans', 50)
         self.min_confidence_score = getattr(config.market_scanner, 'min_confidence_score', 0.7)
         
+        # Token bucket smoothing provider requests to max_rps, with bursts of
+        # up to one second's worth
+        self.max_rps = getattr(config.market_scanner, 'max_rps', 20.0)
+        self._rate_tokens = float(self.max_rps)
+        self._rate_updated = time.monotonic()
+        
+        # One engine serves every stock and strategy; the active strategy set
+        # and the opportunity timestamp are captured once per scan rather
+        # than for each stock
+        self._strategy_engine = StrategyEngine(
+            cache_dir=getattr(config.market_scanner, 'indicator_cache_dir', None)
+        )
+        self.indicator_cache_save_seconds = getattr(config.market_scanner, 'indicator_cache_save_seconds', 900)
+        self._indicator_cache_saved = time.monotonic()
+        self._active_strategies: Tuple[Any, ...] = ()
+        self._scan_timestamp: Optional[datetime] = None
+        
         # Stock universe
         self.stock_universe = self._load_stock_universe()
         self.current_scan_results: Optional[MarketScanResult] = None
@@ -90,7 +112,7 @@ class MarketScanner:
         
         self.logger.info("Market Scanner initialized")
     
-    def _load_stock_universe(self) -> List[str]:
+    def _load_stock_universe(self) -> Tuple[str, ...]:
         """Load the complete stock universe to scan."""
         try:
             # Load from configuration or default to major indices
@@ -160,13 +182,44 @@ class MarketScanner:
                 universe = default_universe
                 self.logger.info(f"No configuration found, using default stock universe")
             
+            universe = self._dedupe_universe(universe)
             self.logger.info(f"Loaded stock universe with {len(universe)} stocks")
             return universe
             
         except Exception as e:
             self.logger.log_error(e, {"operation": "load_stock_universe"})
             # Fallback to basic universe
-            return ["NIFTY", "BANKNIFTY", "RELIANCE", "TCS", "HDFC", "INFY"]
+            return self._dedupe_universe(["NIFTY", "BANKNIFTY", "RELIANCE", "TCS", "HDFC", "INFY"])
+    
+    def _dedupe_universe(self, symbols: List[str]) -> Tuple[str, ...]:
+        """
+        Drop repeated symbols, keeping first-seen order, so each stock is
+        scanned once per cycle. Symbols are interned and returned as a tuple.
+        """
+        seen = set()
+        universe = tuple(sys.intern(symbol) for symbol in symbols if not (symbol in seen or seen.add(symbol)))
+        
+        duplicates = len(symbols) - len(universe)
+        if duplicates:
+            self.logger.info(f"Removed {duplicates} duplicate symbols from stock universe")
+        return universe
+    
+    def set_stock_universe(self, symbols: Optional[List[str]] = None) -> Tuple[str, ...]:
+        """
+        Replace the stock universe scanned from the next cycle on.
+        
+        Args:
+            symbols: Symbols to scan; duplicates are dropped. None restores
+                the configured default universe.
+            
+        Returns:
+            The new stock universe
+        """
+        if symbols is None:
+            self.stock_universe = self._load_stock_universe()
+        else:
+            self.stock_universe = self._dedupe_universe(list(symbols))
+        return self.stock_universe
     
     async def start_scanning(self):
         """Start continuous market scanning."""
@@ -191,18 +244,17 @@ class MarketScanner:
             except asyncio.CancelledError:
                 pass
         
+        await self._save_indicator_cache(force=True)
         self.logger.info("Market scanner stopped")
     
     async def _scan_loop(self):
         """Main scanning loop."""
         while self.is_scanning:
             try:
-                start_time = datetime.now()
-                
                 # Perform market scan
                 scan_result = await self._perform_market_scan()
                 self.current_scan_results = scan_result
-                self.last_scan_time = start_time
+                self.last_scan_time = scan_result.scan_timestamp
                 
                 # Log scan results
                 self.logger.info(f"Market scan completed: {scan_result.opportunities_found} opportunities found "
@@ -219,40 +271,34 @@ class MarketScanner:
     
     async def _perform_market_scan(self) -> MarketScanResult:
         """Perform a complete market scan."""
+        # Wall-clock time once for the result; durations use the monotonic clock
         start_time = datetime.now()
+        started = time.perf_counter()
         opportunities = []
         
         try:
-            # Scan stocks in batches to avoid overwhelming the API
-            batches = self._create_scan_batches()
-            
-            for batch in batches:
-                batch_opportunities = await self._scan_stock_batch(batch)
-                opportunities.extend(batch_opportunities)
-                
-                # Small delay between batches
-                await asyncio.sleep(0.1)
-            
-            # Filter opportunities by confidence score
-            filtered_opportunities = [
-                opp for opp in opportunities 
-                if opp.confidence_score >= self.min_confidence_score
-            ]
+            self._scan_timestamp = start_time
+            self._active_strategies = tuple(self.strategy_manager.get_active_strategies())
+            # Opportunities below min_confidence_score are never emitted, so
+            # the scan's output needs no further filtering
+            opportunities = await self._scan_stock_batch(self.stock_universe)
             
             # Determine market sentiment
-            market_sentiment = self._calculate_market_sentiment(filtered_opportunities)
+            market_sentiment = self._calculate_market_sentiment(opportunities)
             
-            scan_duration = (datetime.now() - start_time).total_seconds()
+            scan_duration = time.perf_counter() - started
             
             # Update performance metrics
             self.scan_count += 1
-            self.total_opportunities_found += len(filtered_opportunities)
+            self.total_opportunities_found += len(opportunities)
+            
+            await self._save_indicator_cache()
             
             return MarketScanResult(
                 scan_timestamp=start_time,
                 total_stocks_scanned=len(self.stock_universe),
-                opportunities_found=len(filtered_opportunities),
-                opportunities=filtered_opportunities,
+                opportunities_found=len(opportunities),
+                opportunities=opportunities,
                 scan_duration=scan_duration,
                 market_sentiment=market_sentiment
             )
@@ -265,61 +311,114 @@ class MarketScanner:
                 total_stocks_scanned=0,
                 opportunities_found=0,
                 opportunities=[],
-                scan_duration=(datetime.now() - start_time).total_seconds(),
+                scan_duration=time.perf_counter() - started,
                 market_sentiment="UNKNOWN"
             )
     
-    def _create_scan_batches(self) -> List[List[str]]:
-        """Create batches of stocks for scanning."""
-        batch_size = min(self.max_concurrent_scans, len(self.stock_universe))
-        batches = []
-        
-        for i in range(0, len(self.stock_universe), batch_size):
-            batch = self.stock_universe[i:i + batch_size]
-            batches.append(batch)
-        
-        return batches
-    
     async def _scan_stock_batch(self, stock_batch: List[str]) -> List[TradingOpportunity]:
-        """Scan a batch of stocks for opportunities."""
+        """
+        Scan a batch of stocks for opportunities.
+        
+        Data is fetched by a pool of max_concurrent_scans workers. Fetched
+        stocks are streamed back in chunks of up to max_concurrent_scans;
+        each chunk's indicators are computed at once on a panel DataFrame
+        before the strategies are applied stock by stock.
+        """
         opportunities = []
         
         try:
-            # Create tasks for concurrent scanning
-            scan_tasks = [
-                self._scan_single_stock(symbol) 
-                for symbol in stock_batch
-            ]
-            
-            # Execute all scans concurrently
-            batch_results = await asyncio.gather(*scan_tasks, return_exceptions=True)
+            # Workers pull the next stock as soon as they finish one, so a
+            # slow stock only ever occupies a single worker
+            queue: asyncio.Queue = asyncio.Queue()
+            for symbol in stock_batch:
+                queue.put_nowait(symbol)
             
-            # Process results
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    self.logger.warning(f"Stock scan failed: {result}")
-                    continue
-                
-                if result:  # If opportunity found
-                    opportunities.append(result)
+            fetched: asyncio.Queue = asyncio.Queue()
+            workers = [
+                asyncio.create_task(self._fetch_worker(queue, fetched))
+                for _ in range(min(self.max_concurrent_scans, len(stock_batch)))
+            ]
+            try:
+                # Process stocks in chunks as they arrive, while the rest are
+                # still being fetched
+                stock_data = []
+                for remaining in range(len(stock_batch) - 1, -1, -1):
+                    market_data = await fetched.get()
+                    if market_data:
+                        stock_data.append(market_data)
+                    
+                    if stock_data and (len(stock_data) >= self.max_concurrent_scans or not remaining):
+                        opportunities.extend(await self._scan_fetched_stocks(stock_data))
+                        stock_data = []
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
             
         except Exception as e:
             self.logger.log_error(e, {"operation": "scan_stock_batch"})
         
         return opportunities
     
-    async def _scan_single_stock(self, symbol: str) -> Optional[TradingOpportunity]:
-        """Scan a single stock for trading opportunities."""
+    async def _fetch_worker(self, queue: asyncio.Queue, fetched: asyncio.Queue):
+        """
+        Fetch data for stocks from the queue until it is empty.
+        
+        Puts exactly one entry on `fetched` per stock: its data, or None if
+        the fetch failed.
+        """
+        while not queue.empty():
+            symbol = queue.get_nowait()
+            market_data = None
+            try:
+                market_data = await self._get_stock_data(symbol)
+            except Exception as e:
+                self.logger.warning(f"Stock data fetch failed for {symbol}: {e}")
+            finally:
+                fetched.put_nowait(market_data)
+    
+    async def _scan_fetched_stocks(self, stock_data: List[Dict[str, Any]]) -> List[TradingOpportunity]:
+        """Compute indicators for a chunk of fetched stocks and apply the strategies."""
+        self._precompute_indicators(stock_data)
+        
+        opportunities = []
+        for market_data in stock_data:
+            result = await self._scan_stock(market_data)
+            # _apply_strategy_to_stock has already applied min_confidence_score
+            if result:  # If opportunity found
+                opportunities.append(result)
+        return opportunities
+    
+    def _precompute_indicators(self, stock_data: List[Dict[str, Any]]) -> None:
+        """
+        Compute indicators for every fetched stock in one vectorized pass.
+        
+        The candles are stacked into a panel indexed by (symbol, bar) and
+        handed to the strategy engine, which caches the results for the
+        strategies. On failure the strategies compute them per stock.
+        """
         try:
-            # Get market data for the stock
-            market_data = await self._get_stock_data(symbol)
-            if not market_data:
-                return None
+            frames = {}
+            for market_data in stock_data:
+                ohlcv = market_data["ohlcv"]
+                if len(ohlcv):
+                    frames.setdefault(market_data["symbol"], ohlcv.reset_index(drop=True))
             
+            if frames:
+                panel = pd.concat(frames, names=["symbol", "bar"])
+                self._strategy_engine.precompute_indicators(panel)
+                
+        except Exception as e:
+            self.logger.log_error(e, {"operation": "precompute_indicators"})
+    
+    async def _scan_stock(self, market_data: Dict[str, Any]) -> Optional[TradingOpportunity]:
+        """Apply every active strategy to one stock's data."""
+        symbol = market_data["symbol"]
+        try:
             # Apply all strategies to the stock
             opportunities = []
             
-            for strategy in self.strategy_manager.get_active_strategies():
+            for strategy in self._active_strategies:
                 try:
                     opportunity = await self._apply_strategy_to_stock(strategy, symbol, market_data)
                     if opportunity:
@@ -335,43 +434,51 @@ class MarketScanner:
             return None
             
         except Exception as e:
-            self.logger.log_error(e, {"operation": "scan_single_stock", "symbol": symbol})
+            self.logger.log_error(e, {"operation": "scan_stock", "symbol": symbol})
             return None
     
+    async def _save_indicator_cache(self, force: bool = False):
+        """
+        Persist new indicator series without blocking the event loop.
+        
+        Writes happen at most once per indicator_cache_save_seconds, so the
+        intra-bar series of every scan are not rewritten; force saves now.
+        """
+        if not self._strategy_engine.cache_dir:
+            return
+        now = time.monotonic()
+        if not force and now - self._indicator_cache_saved < self.indicator_cache_save_seconds:
+            return
+        self._indicator_cache_saved = now
+        
+        try:
+            snapshot = self._strategy_engine.indicator_cache_snapshot()
+            if snapshot:
+                await asyncio.to_thread(self._strategy_engine.save_indicator_snapshot, snapshot)
+        except Exception as e:
+            self.logger.log_error(e, {"operation": "save_indicator_cache"})
+    
     async def _get_stock_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get comprehensive stock data for analysis."""
         try:
-            # Get current market data (synchronous call)
-            current_data = self.market_data_provider.get_market_data(symbol)
+            # Current quote and OHLCV for technical analysis, fetched together
+            current_data, ohlcv_data = await asyncio.gather(
+                self._call_provider('get_market_data', symbol),
+                self._call_provider('get_ohlcv', symbol, "15m")
+            )
             if not current_data:
                 return None
             
-            # Get OHLCV data for technical analysis (synchronous call)
-            ohlcv_data = self.market_data_provider.get_ohlcv(symbol, "15m")
-            
-            # Convert OHLCV to list format for strategy engine
-            ohlcv_list = []
-            if ohlcv_data:
-                for candle in ohlcv_data:
-                    ohlcv_list.append([
-                        candle.timestamp.isoformat(),
-                        float(candle.open) if candle.open else 0,
-                        float(candle.high) if candle.high else 0,
-                        float(candle.low) if candle.low else 0,
-                        float(candle.close) if candle.close else 0,
-                        candle.volume if candle.volume else 0
-                    ])
-            
             # Compile comprehensive data
             stock_data = {
                 "symbol": symbol,
                 "current_price": float(current_data.ltp) if current_data.ltp else 0,
-                "open": float(current_data.open_price) if current_data.open_price else 0,
-                "high": float(current_data.high_price) if current_data.high_price else 0,
-                "low": float(current_data.low_price) if current_data.low_price else 0,
+                "open": float(current_data.open) if current_data.open else 0,
+                "high": float(current_data.high) if current_data.high else 0,
+                "low": float(current_data.low) if current_data.low else 0,
                 "volume": current_data.volume if current_data.volume else 0,
                 "timestamp": current_data.timestamp,
-                "ohlcv": ohlcv_list,
+                "ohlcv": self._ohlcv_frame(ohlcv_data),
                 "change": 0,  # Calculate from open
                 "change_percent": 0
             }
@@ -387,24 +494,88 @@ class MarketScanner:
             self.logger.log_error(e, {"operation": "get_stock_data", "symbol": symbol})
             return None
     
+    def _ohlcv_frame(self, ohlcv_data: Any) -> pd.DataFrame:
+        """
+        Convert provider candles to one DataFrame for the strategy engine.
+        
+        Built column-wise in a single pass: missing prices and volumes
+        become 0, prices are float64 and volume int64.
+        """
+        if ohlcv_data is None or len(ohlcv_data) == 0:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        
+        if isinstance(ohlcv_data, pd.DataFrame):
+            df = ohlcv_data.reindex(columns=OHLCV_COLUMNS)
+        elif isinstance(ohlcv_data[0], dict):
+            df = pd.DataFrame.from_records(ohlcv_data, columns=OHLCV_COLUMNS)
+        else:
+            # OHLCV entities
+            df = pd.DataFrame.from_records(
+                [(c.timestamp, c.open, c.high, c.low, c.close, c.volume) for c in ohlcv_data],
+                columns=OHLCV_COLUMNS
+            )
+        
+        prices = OHLCV_COLUMNS[1:5]
+        df[prices] = df[prices].astype(np.float64).fillna(0.0)
+        df['volume'] = df['volume'].fillna(0).astype(np.int64)
+        return df
+    
+    async def _call_provider(self, method: str, *args: Any) -> Any:
+        """
+        Call a market data provider method without blocking the event loop.
+        
+        Uses the provider's async variant (a{method}) when it has one;
+        otherwise the blocking call runs on a worker thread. Every call
+        first takes a token from the scanner's rate limiter.
+        """
+        await self._arate_limit()
+        
+        async_method = getattr(self.market_data_provider, f"a{method}", None)
+        if async_method is not None:
+            return await async_method(*args)
+        return await asyncio.to_thread(getattr(self.market_data_provider, method), *args)
+    
+    async def _arate_limit(self) -> None:
+        """Wait until the token bucket allows another provider request."""
+        while True:
+            wait_seconds = self._reserve_rate_token()
+            if not wait_seconds:
+                return
+            await asyncio.sleep(wait_seconds)
+    
+    def _reserve_rate_token(self) -> float:
+        """
+        Try to take a request token without blocking.
+        
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available
+        """
+        if self.max_rps <= 0:
+            return 0.0
+        
+        # Refill for the time elapsed since the last request, up to a full bucket
+        now = time.monotonic()
+        self._rate_tokens = min(float(self.max_rps), self._rate_tokens + (now - self._rate_updated) * self.max_rps)
+        self._rate_updated = now
+        
+        if self._rate_tokens >= 1.0:
+            self._rate_tokens -= 1.0
+            return 0.0
+        return (1.0 - self._rate_tokens) / self.max_rps
+    
     async def _apply_strategy_to_stock(self, strategy: Any, symbol: str, stock_data: Dict[str, Any]) -> Optional[TradingOpportunity]:
         """Apply a specific strategy to a stock."""
         try:
-            # Import the strategy engine
-            from .strategy_engine import StrategyEngine
-            
-            # Create strategy engine instance
-            strategy_engine = StrategyEngine()
-            
             # Apply the strategy
-            signal = strategy_engine.apply_strategy(strategy.id, stock_data)
+            signal = self._strategy_engine.apply_strategy(strategy.strategy_id, stock_data)
             
             if signal and signal.confidence_score >= self.min_confidence_score:
-                # Convert StrategySignal to TradingOpportunity
+                # Convert StrategySignal to TradingOpportunity; names are interned
+                # so the opportunity history shares one string per name
                 opportunity = TradingOpportunity(
-                    symbol=symbol,
-                    strategy_name=strategy.name,
-                    strategy_id=strategy.id,
+                    symbol=sys.intern(symbol),
+                    strategy_name=sys.intern(strategy.name),
+                    strategy_id=strategy.strategy_id,
                     signal_type=signal.signal_type,
                     confidence_score=signal.confidence_score,
                     entry_price=signal.entry_price,
@@ -412,7 +583,7 @@ class MarketScanner:
                     stop_loss=signal.stop_loss,
                     risk_reward_ratio=signal.risk_reward_ratio,
                     volume=stock_data.get('volume', 0),
-                    timestamp=datetime.now(),
+                    timestamp=self._scan_timestamp or datetime.now(),
                     indicators=signal.indicators,
                     description=signal.description
                 )
@@ -429,9 +600,10 @@ class MarketScanner:
         if not opportunities:
             return "NEUTRAL"
         
-        # Count buy vs sell signals
-        buy_signals = sum(1 for opp in opportunities if opp.signal_type == "BUY")
-        sell_signals = sum(1 for opp in opportunities if opp.signal_type in ["SELL", "SHORT"])
+        # Count buy vs sell signals in a single pass
+        signal_counts = Counter(opp.signal_type for opp in opportunities)
+        buy_signals = signal_counts["BUY"]
+        sell_signals = signal_counts["SELL"] + signal_counts["SHORT"]
         
         total_signals = len(opportunities)
         buy_ratio = buy_signals / total_signals
@@ -3,14 +3,27 @@ Strategy Engine
 Implements the actual trading logic for all defined strategies.
 """
 
+import json
+import os
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
+from urllib.parse import quote
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from ..core.logging_service import LoggingService
-from .market_scanner import TradingOpportunity
+from . import _indicators_nb as nb
+
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# (name, params) of the indicators precompute_indicators produces
+_PANEL_INDICATORS = (
+    ('sma', ('close', 20)), ('sma', ('close', 14)), ('sma', ('close', 10)), ('sma', ('volume', 20)),
+    ('rsi', (14,)), ('macd', (12, 26, 9)), ('atr', (14,)), ('supertrend', (10, 2)), ('vwap', ()),
+)
 
 
 @dataclass
@@ -32,10 +45,32 @@ class StrategyEngine:
     Implements the actual trading logic for all defined strategies.
     """
     
-    def __init__(self):
-        """Initialize the strategy engine."""
+    def __init__(self, indicator_cache_size: int = 4096, cache_dir: Optional[str] = None):
+        """
+        Initialize the strategy engine.
+        
+        Args:
+            indicator_cache_size: Maximum number of cached indicator series
+            cache_dir: Directory to persist indicator series in across
+                restarts (None keeps them in memory only)
+        """
         self.logger = LoggingService()
         
+        # Indicator series keyed by (symbol, last bar, indicator, params),
+        # shared across strategies and reused until a new bar arrives
+        self.indicator_cache_size = indicator_cache_size
+        self._indicator_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        
+        # On-disk copy: one file per stock holding its latest bar's series,
+        # read the first time the stock is seen
+        self.cache_dir = cache_dir
+        self._disk_checked: set = set()
+        self._unsaved_bars: Dict[str, tuple] = {}  # symbol -> (last, timestamp, close) not yet written
+        
+        # Compile the numba kernels now rather than inside the first scan
+        if nb.NUMBA_AVAILABLE:
+            nb.warmup()
+        
         # Strategy configurations
         self.strategies = {
             "MOMENTUM_BREAKOUT": self._momentum_breakout_strategy,
@@ -92,18 +127,21 @@ class StrategyEngine:
             volume = stock_data['volume']
             ohlcv = stock_data.get('ohlcv', [])
             
-            if not ohlcv or len(ohlcv) < 20:
+            if ohlcv is None or len(ohlcv) < 20:
                 return None
             
             # Convert OHLCV to DataFrame
-            df = pd.DataFrame(ohlcv)
-            df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+            df = self._ohlcv_frame(ohlcv)
             
             # Calculate indicators
-            df['sma_20'] = df['close'].rolling(window=20).mean()
-            df['volume_sma'] = df['volume'].rolling(window=20).mean()
-            df['rsi'] = self._calculate_rsi(df['close'], 14)
-            df['macd'], df['macd_signal'] = self._calculate_macd(df['close'])
+            df['sma_20'] = self._cached_indicator(
+                symbol, df, 'sma', ('close', 20), lambda: self._rolling_mean(df['close'], 20))
+            df['volume_sma'] = self._cached_indicator(
+                symbol, df, 'sma', ('volume', 20), lambda: self._rolling_mean(df['volume'], 20))
+            df['rsi'] = self._cached_indicator(
+                symbol, df, 'rsi', (14,), lambda: self._calculate_rsi(df['close'], 14))
+            df['macd'], df['macd_signal'] = self._cached_indicator(
+                symbol, df, 'macd', (12, 26, 9), lambda: self._calculate_macd(df['close']))
             
             # Get latest values
             current_close = df['close'].iloc[-1]
@@ -158,15 +196,15 @@ class StrategyEngine:
             current_price = stock_data['current_price']
             ohlcv = stock_data.get('ohlcv', [])
             
-            if not ohlcv or len(ohlcv) < 14:
+            if ohlcv is None or len(ohlcv) < 14:
                 return None
             
             # Convert OHLCV to DataFrame
-            df = pd.DataFrame(ohlcv)
-            df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+            df = self._ohlcv_frame(ohlcv)
             
             # Calculate RSI
-            df['rsi'] = self._calculate_rsi(df['close'], 14)
+            df['rsi'] = self._cached_indicator(
+                symbol, df, 'rsi', (14,), lambda: self._calculate_rsi(df['close'], 14))
             current_rsi = df['rsi'].iloc[-1]
             
             # Mean reversion conditions
@@ -227,12 +265,11 @@ class StrategyEngine:
             open_price = stock_data['open']
             ohlcv = stock_data.get('ohlcv', [])
             
-            if not ohlcv or len(ohlcv) < 3:
+            if ohlcv is None or len(ohlcv) < 3:
                 return None
             
             # Convert OHLCV to DataFrame
-            df = pd.DataFrame(ohlcv)
-            df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+            df = self._ohlcv_frame(ohlcv)
             
             # Calculate gap
             prev_close = df['close'].iloc[-2] if len(df) > 1 else open_price
@@ -300,17 +337,17 @@ class StrategyEngine:
             current_price = stock_data['current_price']
             ohlcv = stock_data.get('ohlcv', [])
             
-            if not ohlcv or len(ohlcv) < 20:
+            if ohlcv is None or len(ohlcv) < 20:
                 return None
             
             # Convert OHLCV to DataFrame
-            df = pd.DataFrame(ohlcv)
-            df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+            df = self._ohlcv_frame(ohlcv)
             
             # Calculate VWAP and MA
-            df['vwap'] = (df['close'] * df['volume']).cumsum() / df['volume'].cumsum()
-            df['sma_14'] = df['close'].rolling(window=14).mean()
-            df['atr'] = self._calculate_atr(df, 14)
+            df['vwap'] = self._cached_indicator(symbol, df, 'vwap', (), lambda: self._calculate_vwap(df))
+            df['sma_14'] = self._cached_indicator(
+                symbol, df, 'sma', ('close', 14), lambda: self._rolling_mean(df['close'], 14))
+            df['atr'] = self._cached_indicator(symbol, df, 'atr', (14,), lambda: self._calculate_atr(df, 14))
             
             current_vwap = df['vwap'].iloc[-1]
             current_sma = df['sma_14'].iloc[-1]
@@ -383,12 +420,11 @@ class StrategyEngine:
             volume = stock_data['volume']
             ohlcv = stock_data.get('ohlcv', [])
             
-            if not ohlcv or len(ohlcv) < 10:
+            if ohlcv is None or len(ohlcv) < 10:
                 return None
             
             # Convert OHLCV to DataFrame
-            df = pd.DataFrame(ohlcv)
-            df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+            df = self._ohlcv_frame(ohlcv)
             
             # Check for 2 consecutive high-volume candles
             if len(df) < 2:
@@ -406,9 +442,11 @@ class StrategyEngine:
                 return None
             
             # Calculate indicators
-            df['vwap'] = (df['close'] * df['volume']).cumsum() / df['volume'].cumsum()
-            df['supertrend'] = self._calculate_supertrend(df, 10, 2)
-            df['vwma'] = df['close'].rolling(window=10).mean()
+            df['vwap'] = self._cached_indicator(symbol, df, 'vwap', (), lambda: self._calculate_vwap(df))
+            df['supertrend'] = self._cached_indicator(
+                symbol, df, 'supertrend', (10, 2), lambda: self._calculate_supertrend(df, 10, 2))
+            df['vwma'] = self._cached_indicator(
+                symbol, df, 'sma', ('close', 10), lambda: self._rolling_mean(df['close'], 10))
             
             current_vwap = df['vwap'].iloc[-1]
             current_supertrend = df['supertrend'].iloc[-1]
@@ -464,9 +502,275 @@ class StrategyEngine:
         return None
     
     # Technical indicator calculation methods
+    def _ohlcv_frame(self, ohlcv: Any) -> pd.DataFrame:
+        """
+        Get the candles as a DataFrame the strategy may add columns to.
+        
+        Scanner data arrives as a DataFrame shared by every strategy for the
+        stock, so it is shallow-copied; row lists are converted as before.
+        """
+        if isinstance(ohlcv, pd.DataFrame):
+            return ohlcv.copy(deep=False)
+        
+        df = pd.DataFrame(ohlcv)
+        df.columns = OHLCV_COLUMNS
+        return df
+    
+    def _cached_indicator(self, symbol: str, df: pd.DataFrame, name: str, params: tuple,
+                          compute: Callable[[], Any]) -> Any:
+        """
+        Return an indicator series for the stock's candles, computing it once.
+        
+        The key includes the last bar's timestamp and close, so a new or
+        still-forming bar misses and recomputes. Series are cached as arrays
+        (a tuple of arrays for multi-output indicators like MACD).
+        
+        Args:
+            symbol: Stock symbol
+            df: Candles the indicator is computed from
+            name: Indicator name
+            params: Indicator parameters
+            compute: Computes the indicator on a cache miss
+            
+        Returns:
+            Indicator values aligned with df's rows
+        """
+        last = len(df) - 1
+        key = (symbol, last, df['timestamp'].iat[last], df['close'].iat[last], name, params)
+        
+        cache = self._indicator_cache
+        if symbol not in self._disk_checked:
+            self._load_indicator_file(symbol, key[1:4])
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+            return value
+        
+        value = compute()
+        if isinstance(value, tuple):
+            value = tuple(series.to_numpy() for series in value)
+        else:
+            value = value.to_numpy()
+        
+        self._store_indicator(key, value)
+        return value
+    
+    def _store_indicator(self, key: tuple, value: Any, persist: bool = True) -> None:
+        """Add an indicator to the cache, evicting the least recently used."""
+        cache = self._indicator_cache
+        cache[key] = value
+        if len(cache) > self.indicator_cache_size:
+            cache.popitem(last=False)
+        
+        if persist and self.cache_dir:
+            self._unsaved_bars[key[0]] = key[1:4]
+    
+    def _indicator_file(self, symbol: str) -> str:
+        """Path of a stock's indicator file (symbols may contain & or /)."""
+        return os.path.join(self.cache_dir, f"{quote(symbol, safe='')}.npz")
+    
+    @staticmethod
+    def _bar_fingerprint(bar: tuple) -> str:
+        """Text identifying a (last, timestamp, close) bar, stored with its series."""
+        last, timestamp, close = bar
+        return f"{int(last)}|{timestamp}|{float(close)!r}"
+    
+    def _load_indicator_file(self, symbol: str, bar: tuple) -> None:
+        """
+        Load a stock's persisted indicator series into the cache, once per stock.
+        
+        The file only holds series for the bar it was written at, so it is
+        used only if that is the stock's current (last, timestamp, close) bar.
+        Keys are rebuilt from the current bar, keeping their exact types.
+        """
+        self._disk_checked.add(symbol)
+        if not self.cache_dir:
+            return
+        
+        cache_file = self._indicator_file(symbol)
+        if not os.path.exists(cache_file):
+            return
+        
+        try:
+            with np.load(cache_file, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                if meta['bar'] != self._bar_fingerprint(bar):
+                    return
+                
+                for index, (name, params, count) in enumerate(meta['entries']):
+                    if count is None:
+                        value = data[f"s{index}"]
+                    else:
+                        value = tuple(data[f"s{index}_{part}"] for part in range(count))
+                    self._store_indicator((symbol,) + bar + (name, tuple(params)), value, persist=False)
+        except Exception as e:
+            self.logger.warning(f"Failed to load indicator cache for {symbol}: {str(e)}")
+    
+    def indicator_cache_snapshot(self) -> Dict[str, Dict[tuple, Any]]:
+        """
+        Collect the series computed since the last snapshot for persisting.
+        
+        Only each stock's latest bar is kept. Call on the thread that uses
+        the engine; the snapshot can then be saved from any thread.
+        
+        Returns:
+            Per stock, its indicator series keyed by cache key minus the symbol
+        """
+        if not self._unsaved_bars:
+            return {}
+        
+        snapshot: Dict[str, Dict[tuple, Any]] = {}
+        for key, value in self._indicator_cache.items():
+            bar = self._unsaved_bars.get(key[0])
+            if bar is not None and key[1:4] == bar:
+                snapshot.setdefault(key[0], {})[key[1:]] = value
+        
+        self._unsaved_bars.clear()
+        return snapshot
+    
+    def save_indicator_snapshot(self, snapshot: Dict[str, Dict[tuple, Any]]) -> None:
+        """
+        Write a snapshot from indicator_cache_snapshot to cache_dir.
+        
+        Each stock gets one .npz file: its series as plain float arrays plus
+        a JSON header naming the bar and indicators, so nothing is pickled.
+        
+        Args:
+            snapshot: Indicator series per stock
+        """
+        if not self.cache_dir or not snapshot:
+            return
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except Exception as e:
+            self.logger.warning(f"Failed to create indicator cache directory: {str(e)}")
+            return
+        
+        for symbol, entries in snapshot.items():
+            cache_file = self._indicator_file(symbol)
+            try:
+                arrays: Dict[str, np.ndarray] = {}
+                meta_entries = []
+                for index, (key_tail, value) in enumerate(entries.items()):
+                    if isinstance(value, tuple):
+                        for part, series in enumerate(value):
+                            arrays[f"s{index}_{part}"] = series
+                        meta_entries.append((key_tail[3], key_tail[4], len(value)))
+                    else:
+                        arrays[f"s{index}"] = value
+                        meta_entries.append((key_tail[3], key_tail[4], None))
+                meta = {"bar": self._bar_fingerprint(key_tail[:3]), "entries": meta_entries}
+                
+                # Write to a temp file and swap it in so readers never see a partial file
+                tmp_file = f"{cache_file}.tmp"
+                with open(tmp_file, 'wb') as f:
+                    np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+                os.replace(tmp_file, cache_file)
+            except Exception as e:
+                self.logger.warning(f"Failed to save indicator cache for {symbol}: {str(e)}")
+    
+    def precompute_indicators(self, panel: pd.DataFrame) -> None:
+        """
+        Compute the strategies' indicators for many stocks in one pass.
+        
+        The panel holds every stock's candles indexed by (symbol, bar), each
+        stock's rows contiguous and in bar order. Indicators are computed
+        across the whole panel with groupby operations, using the same
+        formulas as the per-stock helpers, and stored in the indicator cache
+        where the strategies look them up. Stocks whose latest bar is
+        already cached, in memory or on disk, are left out of the pass.
+        
+        Args:
+            panel: Candles for many stocks, indexed by (symbol, bar)
+        """
+        if panel.empty:
+            return
+        
+        groups = panel.groupby(level='symbol', sort=False).indices
+        timestamps, closes = panel['timestamp'], panel['close']
+        bar_keys = {}
+        for symbol, rows in groups.items():
+            last = rows[-1]
+            bar_key = (symbol, len(rows) - 1, timestamps.iat[last], closes.iat[last])
+            if symbol not in self._disk_checked:
+                self._load_indicator_file(symbol, bar_key[1:])
+            if any(bar_key + indicator not in self._indicator_cache for indicator in _PANEL_INDICATORS):
+                bar_keys[symbol] = bar_key
+        
+        if not bar_keys:
+            return
+        if len(bar_keys) < len(groups):
+            panel = panel.loc[list(bar_keys)]
+        
+        def by_symbol(series: pd.Series):
+            return series.groupby(level='symbol', sort=False)
+        
+        def rolling_mean(series: pd.Series, window: int) -> pd.Series:
+            return by_symbol(series).rolling(window=window).mean().droplevel(0)
+        
+        def ewm_mean(series: pd.Series, span: int) -> pd.Series:
+            return by_symbol(series).ewm(span=span).mean().droplevel(0)
+        
+        high, low, close, volume = panel['high'], panel['low'], panel['close'], panel['volume']
+        
+        delta = by_symbol(close).diff()
+        rs = rolling_mean(delta.where(delta > 0, 0), 14) / rolling_mean(-delta.where(delta < 0, 0), 14)
+        
+        macd = ewm_mean(close, 12) - ewm_mean(close, 26)
+        
+        prev_close = by_symbol(close).shift()
+        true_range = pd.concat([high - low, abs(high - prev_close), abs(low - prev_close)], axis=1).max(axis=1)
+        atr_10 = rolling_mean(true_range, 10)
+        
+        indicators = {
+            ('sma', ('close', 20)): rolling_mean(close, 20),
+            ('sma', ('close', 14)): rolling_mean(close, 14),
+            ('sma', ('close', 10)): rolling_mean(close, 10),
+            ('sma', ('volume', 20)): rolling_mean(volume, 20),
+            ('rsi', (14,)): 100 - (100 / (1 + rs)),
+            ('macd', (12, 26, 9)): (macd, ewm_mean(macd, 9)),
+            ('atr', (14,)): rolling_mean(true_range, 14),
+            ('supertrend', (10, 2)): (high + low) / 2 - (2 * atr_10),
+            ('vwap', ()): by_symbol(close * volume).cumsum() / by_symbol(volume).cumsum(),
+        }
+        arrays = {
+            name: tuple(series.to_numpy() for series in value) if isinstance(value, tuple) else value.to_numpy()
+            for name, value in indicators.items()
+        }
+        
+        # Slice each stock's rows out under the key _cached_indicator builds
+        for symbol, rows in panel.groupby(level='symbol', sort=False).indices.items():
+            bar_key = bar_keys[symbol]
+            for (name, params), values in arrays.items():
+                if isinstance(values, tuple):
+                    value = tuple(array[rows] for array in values)
+                else:
+                    value = values[rows]
+                self._store_indicator(bar_key + (name, params), value)
+    
+    # Indicator maths: the numba kernels when numba is installed, pandas
+    # otherwise. Both compute the same formulas.
+    
+    def _rolling_mean(self, values: pd.Series, window: int) -> pd.Series:
+        """Calculate a simple moving average."""
+        if nb.NUMBA_AVAILABLE:
+            return pd.Series(nb.rolling_mean(values.to_numpy(np.float64), window), index=values.index)
+        return values.rolling(window=window).mean()
+    
+    def _calculate_vwap(self, df: pd.DataFrame) -> pd.Series:
+        """Calculate cumulative VWAP over the candles."""
+        if nb.NUMBA_AVAILABLE:
+            return pd.Series(nb.vwap(df['close'].to_numpy(np.float64), df['volume'].to_numpy(np.float64)),
+                             index=df.index)
+        return (df['close'] * df['volume']).cumsum() / df['volume'].cumsum()
+    
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """Calculate RSI indicator."""
         try:
+            if nb.NUMBA_AVAILABLE:
+                return pd.Series(nb.rsi(prices.to_numpy(np.float64), period), index=prices.index)
+            
             delta = prices.diff()
             gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
             loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
@@ -479,6 +783,10 @@ class StrategyEngine:
     def _calculate_macd(self, prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series]:
         """Calculate MACD indicator."""
         try:
+            if nb.NUMBA_AVAILABLE:
+                macd, macd_signal = nb.macd(prices.to_numpy(np.float64), fast, slow, signal)
+                return pd.Series(macd, index=prices.index), pd.Series(macd_signal, index=prices.index)
+            
             ema_fast = prices.ewm(span=fast).mean()
             ema_slow = prices.ewm(span=slow).mean()
             macd = ema_fast - ema_slow
@@ -490,6 +798,10 @@ class StrategyEngine:
     def _calculate_atr(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
         """Calculate Average True Range indicator."""
         try:
+            if nb.NUMBA_AVAILABLE:
+                return pd.Series(nb.atr(df['high'].to_numpy(np.float64), df['low'].to_numpy(np.float64),
+                                        df['close'].to_numpy(np.float64), period), index=df.index)
+            
             high = df['high']
             low = df['low']
             close = df['close']
@@ -347,6 +347,15 @@ class StrategyManager(IStrategyManager):
             self.logger.log_error(e, {"operation": "get_strategies"})
             return []
 
+    def get_active_strategies(self) -> List[Strategy]:
+        """
+        Get the enabled strategies.
+
+        Returns:
+            List of active strategies
+        """
+        return self.get_strategies(active_only=True)
+
     def get_strategy_summary(self) -> Dict[str, Any]:
         """
         Get summary of all strategies.
@@ -0,0 +1,82 @@
+"""
+The numba indicator kernels must match the pandas formulas the strategy
+engine falls back to, including on series with missing values.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dhan_advanced_algo.providers import _indicators_nb as nb
+
+
+def _series(n=100, nan_at=(5,), seed=7):
+    rng = np.random.default_rng(seed)
+    values = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+    values[list(nan_at)] = np.nan
+    return values
+
+
+def _assert_matches(actual, expected):
+    expected = np.asarray(expected, dtype=np.float64)
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize("nan_at", [(), (5,), (0, 1), (30, 31, 60), (99,)])
+@pytest.mark.parametrize("window", [1, 10, 20])
+def test_rolling_mean_matches_pandas(nan_at, window):
+    values = _series(nan_at=nan_at)
+    _assert_matches(nb.rolling_mean(values, window), pd.Series(values).rolling(window=window).mean())
+
+
+def test_rolling_mean_recovers_after_nan():
+    values = _series(nan_at=(5,))
+    out = nb.rolling_mean(values, 20)
+    assert np.isnan(out[5:25]).all()
+    assert not np.isnan(out[25:]).any()
+
+
+@pytest.mark.parametrize("nan_at", [(), (0,), (5,), (30, 31, 60)])
+@pytest.mark.parametrize("span", [9, 12, 26])
+def test_ewm_mean_matches_pandas(nan_at, span):
+    values = _series(nan_at=nan_at)
+    _assert_matches(nb.ewm_mean(values, span), pd.Series(values).ewm(span=span).mean())
+
+
+@pytest.mark.parametrize("nan_at", [(), (5,), (30, 31, 60)])
+def test_rsi_matches_pandas(nan_at):
+    close = pd.Series(_series(nan_at=nan_at))
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    _assert_matches(nb.rsi(close.to_numpy(), 14), 100 - (100 / (1 + gain / loss)))
+
+
+@pytest.mark.parametrize("nan_at", [(), (5,), (30, 31, 60)])
+def test_macd_matches_pandas(nan_at):
+    close = pd.Series(_series(nan_at=nan_at))
+    line = close.ewm(span=12).mean() - close.ewm(span=26).mean()
+    macd, signal = nb.macd(close.to_numpy(), 12, 26, 9)
+    _assert_matches(macd, line)
+    _assert_matches(signal, line.ewm(span=9).mean())
+
+
+@pytest.mark.parametrize("nan_at", [(), (5,), (30, 31, 60)])
+def test_atr_matches_pandas(nan_at):
+    close = pd.Series(_series(nan_at=nan_at))
+    high, low = close + 1.5, close - 1.0
+    true_range = pd.concat(
+        [high - low, abs(high - close.shift()), abs(low - close.shift())], axis=1
+    ).max(axis=1)
+    actual = nb.atr(high.to_numpy(), low.to_numpy(), close.to_numpy(), 14)
+    _assert_matches(actual, true_range.rolling(window=14).mean())
+
+
+@pytest.mark.parametrize("nan_at", [(), (5,), (30, 31, 60)])
+def test_vwap_matches_pandas(nan_at):
+    close = pd.Series(_series(nan_at=nan_at))
+    volume = pd.Series(_series(nan_at=(), seed=11)) * 100.0
+    volume[45] = np.nan
+    expected = (close * volume).cumsum() / volume.cumsum()
+    _assert_matches(nb.vwap(close.to_numpy(), volume.to_numpy()), expected)